@@ -18,13 +18,18 @@ Usage:
 Author: Cybertron
 """
 
+import io
 import os
 import sys
 import subprocess
 import shutil
 import platform
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from importlib.metadata import version, PackageNotFoundError
 
 
 # ============================================================================
@@ -86,29 +91,65 @@ def print_warning(text):
     print(f"   ⚠ {text}")
 
 
-def run_command(cmd, cwd=None, check=True):
-    """Run a shell command and return the result."""
+def run_command(cmd, cwd=None, check=True, capture=False):
+    """Run a shell command and return the result.
+    
+    Output streams straight to the terminal unless capture is set.
+    """
     print(f"   Running: {' '.join(cmd) if isinstance(cmd, list) else cmd}")
     try:
         result = subprocess.run(
             cmd,
             cwd=cwd,
             check=check,
-            capture_output=True,
-            text=True,
+            capture_output=capture,
+            text=capture,
             shell=isinstance(cmd, str)
         )
         return result
     except subprocess.CalledProcessError as e:
-        print_error(f"Command failed: {e.stderr}")
+        print_error(f"Command failed: {e.stderr or e}")
         raise
 
 
+class _PerThreadStdout:
+    """Stdout proxy that sends a thread's prints to its own buffer, if set."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self, buffer):
+        self._local.buffer = buffer
+    
+    def write(self, text):
+        return (getattr(self._local, "buffer", None) or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+
+@lru_cache(maxsize=None)
 def check_command_exists(cmd):
     """Check if a command exists in PATH."""
     return shutil.which(cmd) is not None
 
 
+def write_if_changed(path, content, header=""):
+    """Write header + content, leaving the file untouched if content matches.
+    
+    Keeping mtimes stable lets pyside6-deploy/Gradle skip unchanged steps.
+    The header (e.g. a generation timestamp) is not compared.
+    """
+    try:
+        if path.read_text().endswith(content):
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_text(header + content)
+    return True
+
+
 # ============================================================================
 # ENVIRONMENT CHECKS
 # ============================================================================
@@ -143,7 +184,7 @@ def check_java():
     
     # Check Java version
     try:
-        result = run_command(["java", "-version"], check=False)
+        result = run_command(["java", "-version"], check=False, capture=True)
         version_output = result.stderr or result.stdout
         print_success(f"JAVA_HOME: {java_home}")
         return True
@@ -173,11 +214,11 @@ def check_android_sdk():
     build_tools = sdk_path / "build-tools"
     platforms = sdk_path / "platforms"
     
-    if not build_tools.exists() or not list(build_tools.glob("*")):
+    if not build_tools.exists() or next(build_tools.iterdir(), None) is None:
         print_warning("Android build-tools not found")
         print("   Run: sdkmanager 'build-tools;34.0.0'")
     
-    if not platforms.exists() or not list(platforms.glob("*")):
+    if not platforms.exists() or next(platforms.iterdir(), None) is None:
         print_warning("Android platforms not found")
         print("   Run: sdkmanager 'platforms;android-34'")
     
@@ -190,8 +231,8 @@ def check_pyside6():
     print_step(4, "Checking PySide6...")
     
     try:
-        import PySide6
-        from PySide6 import __version__ as pyside_version
+        # Read the installed distribution's metadata rather than importing Qt
+        pyside_version = version("PySide6")
         print_success(f"PySide6 {pyside_version}")
         
         # Check if pyside6-deploy is available
@@ -203,7 +244,7 @@ def check_pyside6():
             print("   Make sure PySide6 is installed: pip install PySide6")
             return False
             
-    except ImportError:
+    except PackageNotFoundError:
         print_error("PySide6 not installed")
         print("   Install with: pip install PySide6")
         return False
@@ -235,15 +276,36 @@ def check_all():
     """Run all environment checks."""
     print_header("Environment Checks")
     
+    # The checks are independent (mostly waiting on java/filesystem), so run
+    # them side by side and print each one's output afterwards, in order
     checks = [
-        check_python(),
-        check_java(),
-        check_android_sdk(),
-        check_pyside6(),
-        check_project_structure(),
+        check_python,
+        check_java,
+        check_android_sdk,
+        check_pyside6,
+        check_project_structure,
     ]
+    stdout = _PerThreadStdout(sys.stdout)
+    
+    def run_check(check):
+        buffer = io.StringIO()
+        stdout.capture(buffer)
+        try:
+            return check(), buffer.getvalue()
+        finally:
+            stdout.capture(None)
+    
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            results = list(executor.map(run_check, checks))
+    finally:
+        sys.stdout = stdout._stream
+    
+    for _, output in results:
+        sys.stdout.write(output)
     
-    if all(checks):
+    if all(ok for ok, _ in results):
         print("\n" + "=" * 60)
         print("   All checks passed! Ready to build.")
         print("=" * 60)
@@ -301,8 +363,10 @@ arch = arm64-v8a
 """
     
     spec_path = PROJECT_ROOT / "pysidedeploy.spec"
-    spec_path.write_text(spec_content)
-    print_success(f"Created: {spec_path}")
+    if write_if_changed(spec_path, spec_content):
+        print_success(f"Created: {spec_path}")
+    else:
+        print_success(f"Unchanged: {spec_path}")
     return spec_path
 
 
@@ -375,8 +439,10 @@ def create_android_manifest():
 """
     
     manifest_path = ANDROID_DIR / "AndroidManifest.xml"
-    manifest_path.write_text(manifest_content)
-    print_success(f"Created: {manifest_path}")
+    if write_if_changed(manifest_path, manifest_content):
+        print_success(f"Created: {manifest_path}")
+    else:
+        print_success(f"Unchanged: {manifest_path}")
     
     # Create file_paths.xml for FileProvider
     xml_dir = ANDROID_DIR / "res" / "xml"
@@ -390,17 +456,21 @@ def create_android_manifest():
 </paths>
 """
     
-    (xml_dir / "file_paths.xml").write_text(file_paths_content)
-    print_success(f"Created: {xml_dir / 'file_paths.xml'}")
+    file_paths_path = xml_dir / "file_paths.xml"
+    if write_if_changed(file_paths_path, file_paths_content):
+        print_success(f"Created: {file_paths_path}")
+    else:
+        print_success(f"Unchanged: {file_paths_path}")
 
 
 def create_build_instructions():
     """Create detailed build instructions file."""
     print_step(3, "Creating build instructions...")
     
-    instructions = f"""# Android APK Build Instructions
+    header = f"""# Android APK Build Instructions
 # Generated: {datetime.now().isoformat()}
-
+"""
+    instructions = f"""
 ## Prerequisites
 
 1. **Java JDK 17+**
@@ -510,8 +580,10 @@ adb install -r path/to/your-app.apk
 """
     
     instructions_path = PROJECT_ROOT / "ANDROID_BUILD.md"
-    instructions_path.write_text(instructions)
-    print_success(f"Created: {instructions_path}")
+    if write_if_changed(instructions_path, instructions, header):
+        print_success(f"Created: {instructions_path}")
+    else:
+        print_success(f"Unchanged: {instructions_path}")
     return instructions_path
 
 
@@ -14,11 +14,9 @@ def build_mobile_app():
     dist_dir = project_root / "dist"
     build_dir = project_root / "build"
     
-    # Clean previous builds
-    if dist_dir.exists():
-        shutil.rmtree(dist_dir)
-    if build_dir.exists():
-        shutil.rmtree(build_dir)
+    # Clean previous builds (a missing directory is fine)
+    shutil.rmtree(dist_dir, ignore_errors=True)
+    shutil.rmtree(build_dir, ignore_errors=True)
         
     print("🚀 Starting PyInstaller Build for Mobile App...")
         
@@ -43,9 +41,10 @@ def build_mobile_app():
         "--hidden-import", "yt_dlp.extractor.youtube",
         "--hidden-import", "yt_dlp.extractor.common",
         
-        # Optimization: Exclude heavy unnecessary modules if possible
-        # but be careful with yt-dlp as it lazy loads everything
-        "--collect-all", "yt_dlp", 
+        # Only the YouTube extractor package needs collecting explicitly;
+        # yt-dlp's bundled PyInstaller hook pulls in what its loader imports
+        "--collect-submodules", "yt_dlp.extractor.youtube",
+        "--collect-data", "yt_dlp",
         
         # Main entry point
         str(project_root / "src/mobile/main.py")
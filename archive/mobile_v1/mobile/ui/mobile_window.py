@@ -2,28 +2,35 @@
 import sys
 import os
 import shutil
+import time
+import hashlib
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List
-import urllib.request
+from collections import deque
+import urllib3
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QTextEdit, QPushButton, QComboBox, QSpinBox,
-    QProgressBar, QButtonGroup, QListWidget, QListWidgetItem, 
+    QProgressBar, QButtonGroup, QListView, QStyledItemDelegate,
     QFrame, QMessageBox, QStackedWidget, QScrollArea, QSizePolicy,
-    QScroller, QGraphicsDropShadowEffect, QDialog, QGridLayout,
+    QScroller, QDialog, QGridLayout,
     QInputDialog, QFileDialog, QLineEdit
 )
-from PySide6.QtCore import Qt, Slot, QSize, QRect, QPropertyAnimation, QEasingCurve, QTimer, QPoint, QThread, Signal, QByteArray
+from PySide6.QtCore import (
+    Qt, Slot, QSize, QRect, QPropertyAnimation, QEasingCurve, QTimer, QPoint, QThread, Signal, QByteArray,
+    QObject, QRunnable, QThreadPool, QStandardPaths, QBuffer, QIODevice,
+    QAbstractListModel, QModelIndex
+)
 from PySide6.QtGui import (
     QPalette, QColor, QFont, QIcon, QPainter, QLinearGradient, 
     QBrush, QPen, QRadialGradient, QFontDatabase, QClipboard, QGuiApplication,
-    QPixmap, QImage
+    QPixmap, QImage, QImageReader, QPixmapCache, QFontMetrics, QGradient
 )
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
-from src.core.worker import DownloadManager, DownloadMode
+from src.core.worker import DownloadManager, DownloadMode, HISTORY_LIMIT
 from src.core.utils import extract_youtube_urls, resource_path
 
 # --- CONSTANTS ---
@@ -38,6 +45,20 @@ COLOR_BORDER = "#2C2C2E"
 COLOR_SUCCESS = "#30D158"
 COLOR_ERROR = "#FF453A"
 
+# Thumbnails come from a handful of CDN hosts; keep their connections open
+# for the life of the app instead of reconnecting for every row
+THUMB_HTTP = urllib3.PoolManager(num_pools=4, maxsize=16, headers={'User-Agent': 'Mozilla/5.0'})
+THUMB_TIMEOUT = urllib3.Timeout(connect=2.0, read=5.0)
+THUMB_MAX_BYTES = 256 * 1024  # Far above any real YouTube thumbnail
+THUMB_PIXMAP_CACHE_KB = 32 * 1024  # In-memory rounded thumbnails for this session
+# Cropped thumbnails kept on disk; least recently used go first past this size
+THUMB_CACHE_LIMIT = 500 * 1024 * 1024
+ROW_UPDATE_INTERVAL_NS = 100_000_000  # Repaint a row's progress at most 10x/s
+QUEUE_ROW_HEIGHT = 85
+QUEUE_ROW_SPACING = 12
+MOBILE_WORKERS = 3  # Parallel downloads until changed in Settings
+URL_RECOUNT_DELAY_MS = 150  # Wait for typing/pasting to settle before rescanning
+
 # --- STYLESHEET ---
 GLOBAL_STYLES = f"""
     QMainWindow, QWidget {{
@@ -86,19 +107,19 @@ GLOBAL_STYLES = f"""
     QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
         height: 0;
     }}
-    QListWidget {{
+    QListView {{
         background: transparent;
         border: none;
         outline: none;
     }}
-    QListWidget::item {{
+    QListView::item {{
         background-color: {COLOR_SURFACE};
         border-radius: 12px;
         padding: 16px;
         margin-bottom: 10px;
         color: {COLOR_TEXT_HEAD};
     }}
-    QListWidget::item:selected {{
+    QListView::item:selected {{
         background-color: {COLOR_SURFACE_2};
         border: 1px solid {COLOR_ACCENT};
     }}
@@ -114,13 +135,6 @@ class NeonButton(QPushButton):
         self.setFont(QFont("Arial", 16, QFont.Bold))
         self.setCursor(Qt.PointingHandCursor)
         self._update_style(False)
-        
-        # Glow effect
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(30)
-        shadow.setColor(QColor(255, 49, 49, 150))
-        shadow.setOffset(0, 4)
-        self.setGraphicsEffect(shadow)
     
     def _update_style(self, loading=False):
         bg = "#555" if loading else COLOR_ACCENT
@@ -130,6 +144,8 @@ class NeonButton(QPushButton):
                 color: white;
                 border-radius: 14px;
                 border: none;
+                /* Glow drawn as a border, not a per-repaint blur effect */
+                border-bottom: 4px solid {'#333' if loading else 'rgba(255, 49, 49, 150)'};
                 letter-spacing: 1px;
             }}
             QPushButton:hover {{ background-color: {'#666' if loading else '#E02828'}; }}
@@ -164,6 +180,10 @@ class SecondaryButton(QPushButton):
 
 class NavButton(QPushButton):
     """Bottom Navigation Button"""
+    _ICON_FONT = None
+    _LABEL_FONT_BOLD = None
+    _LABEL_FONT_NORMAL = None
+    
     def __init__(self, icon_text, label, parent=None):
         super().__init__(parent)
         self.icon_text = icon_text
@@ -187,17 +207,22 @@ class NavButton(QPushButton):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        color = QColor(COLOR_ACCENT) if self.isChecked() else QColor(COLOR_TEXT_BODY)
+        checked = self.isChecked()
+        color = QColor(COLOR_ACCENT) if checked else QColor(COLOR_TEXT_BODY)
         painter.setPen(color)
         
+        # Fonts are built on first paint (a QGuiApplication must exist) and shared
+        if NavButton._ICON_FONT is None:
+            NavButton._ICON_FONT = QFont("Arial", 22)
+            NavButton._LABEL_FONT_BOLD = QFont("Arial", 10, QFont.Bold)
+            NavButton._LABEL_FONT_NORMAL = QFont("Arial", 10)
+        
         # Icon
-        icon_font = QFont("Arial", 22)
-        painter.setFont(icon_font)
+        painter.setFont(NavButton._ICON_FONT)
         painter.drawText(QRect(0, 5, self.width(), 30), Qt.AlignCenter, self.icon_text)
         
         # Label
-        label_font = QFont("Arial", 10, QFont.Bold if self.isChecked() else QFont.Normal)
-        painter.setFont(label_font)
+        painter.setFont(NavButton._LABEL_FONT_BOLD if checked else NavButton._LABEL_FONT_NORMAL)
         painter.drawText(QRect(0, 38, self.width(), 20), Qt.AlignCenter, self.label)
 
 class BentoCard(QFrame):
@@ -212,190 +237,346 @@ class BentoCard(QFrame):
             }}
         """)
 
-class ThumbnailLoader(QThread):
-    """Background thread to load thumbnails"""
-    thumbnail_loaded = Signal(str, QPixmap)  # item_id, pixmap
+class ThumbnailSignals(QObject):
+    """Signals for a thumbnail job"""
+    thumbnail_loaded = Signal(str, QImage)  # item_id, image
+
+class ThumbnailJob(QRunnable):
+    """Download and crop one thumbnail on the service's thread pool"""
     
-    def __init__(self, item_id, url):
+    def __init__(self, item_id, url, cache_path):
         super().__init__()
         self.item_id = item_id
         self.url = url
+        self.cache_path = cache_path
+        self.signals = ThumbnailSignals()
+        self.setAutoDelete(True)
     
     def run(self):
         try:
-            # Download image
-            req = urllib.request.Request(self.url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = response.read()
+            # Download image, streaming at most THUMB_MAX_BYTES
+            response = THUMB_HTTP.request('GET', self.url, timeout=THUMB_TIMEOUT, preload_content=False)
+            try:
+                if response.status != 200:
+                    return
+                length = response.headers.get('Content-Length')
+                if length and length.isdigit() and int(length) > THUMB_MAX_BYTES:
+                    return
+                data = response.read(THUMB_MAX_BYTES + 1)
+                if len(data) > THUMB_MAX_BYTES:
+                    return
+            finally:
+                response.release_conn()
             
-            # Convert to QPixmap
-            image = QImage()
-            image.loadFromData(QByteArray(data))
+            # Decode straight to ~120px: JPEG scales during the IDCT, so the
+            # full-size frame is never allocated
+            buffer = QBuffer()
+            buffer.setData(QByteArray(data))
+            buffer.open(QIODevice.ReadOnly)
+            reader = QImageReader(buffer)
+            reader.setAutoTransform(True)
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(120, 120, Qt.KeepAspectRatioByExpanding))
+            image = reader.read()
             
             if not image.isNull():
-                pixmap = QPixmap.fromImage(image)
+                # QImage, unlike QPixmap, is safe to use off the GUI thread.
+                # Formats the reader could not pre-scale drop to ~120px with a
+                # cheap nearest-neighbour pass; only the last step is filtered.
+                if image.width() > 120 and image.height() > 120:
+                    image = image.scaled(120, 120, Qt.KeepAspectRatioByExpanding, Qt.FastTransformation)
                 # Scale to 60x60 with aspect ratio
-                pixmap = pixmap.scaled(60, 60, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+                image = image.scaled(60, 60, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
                 # Crop to center
-                if pixmap.width() > 60 or pixmap.height() > 60:
-                    x = (pixmap.width() - 60) // 2
-                    y = (pixmap.height() - 60) // 2
-                    pixmap = pixmap.copy(x, y, 60, 60)
+                if image.width() > 60 or image.height() > 60:
+                    x = (image.width() - 60) // 2
+                    y = (image.height() - 60) // 2
+                    image = image.copy(x, y, 60, 60)
                 
-                self.thumbnail_loaded.emit(self.item_id, pixmap)
+                self.signals.thumbnail_loaded.emit(self.item_id, image)
+                
+                # Another row may have cached the same URL meanwhile
+                if not self.cache_path.exists():
+                    tmp_path = self.cache_path.with_suffix(".tmp")
+                    if image.save(str(tmp_path), "PNG"):
+                        os.replace(tmp_path, self.cache_path)
         except Exception as e:
             print(f"Thumbnail load error: {e}")
 
-class ActivityRow(QWidget):
-    """Download Item Row with Thumbnail and Live Progress"""
-    def __init__(self, item_id, title, status="Preparing...", thumbnail_url="", parent=None):
-        super().__init__(parent)
-        self.item_id = item_id
-        self.thumbnail_loader = None
-        self.setFixedHeight(85)
-        self.setStyleSheet(f"background-color: {COLOR_SURFACE}; border-radius: 14px;")
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 10, 14, 10)
-        layout.setSpacing(12)
-        
-        # Thumbnail Container
-        self.thumb_container = QWidget()
-        self.thumb_container.setFixedSize(65, 65)
-        self.thumb_container.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #1a1a1a, stop:1 #2a2a2a);
-            border-radius: 10px;
-        """)
-        
-        thumb_layout = QVBoxLayout(self.thumb_container)
-        thumb_layout.setContentsMargins(0, 0, 0, 0)
-        thumb_layout.setAlignment(Qt.AlignCenter)
-        
-        # Thumbnail Label (will show image or icon)
-        self.thumb_label = QLabel("⏳")
-        self.thumb_label.setFixedSize(60, 60)
-        self.thumb_label.setAlignment(Qt.AlignCenter)
-        self.thumb_label.setStyleSheet(f"""
-            background: transparent;
-            border-radius: 8px; 
-            color: {COLOR_ACCENT}; 
-            font-size: 24px;
-        """)
-        thumb_layout.addWidget(self.thumb_label)
-        layout.addWidget(self.thumb_container)
-        
-        # Load thumbnail if URL provided
-        if thumbnail_url:
-            self._load_thumbnail(thumbnail_url)
-        
-        # Info Section
-        vbox = QVBoxLayout()
-        vbox.setSpacing(4)
-        vbox.setContentsMargins(0, 2, 0, 2)
-        
-        display_title = title[:38] + "..." if len(title) > 38 else title
-        self.title_lbl = QLabel(display_title)
-        self.title_lbl.setStyleSheet(f"color: {COLOR_TEXT_HEAD}; font-weight: 600; font-size: 13px; background: transparent;")
-        
-        self.status_lbl = QLabel(status)
-        self.status_lbl.setStyleSheet(f"color: {COLOR_TEXT_BODY}; font-size: 11px; background: transparent;")
-        
-        self.pbar = QProgressBar()
-        self.pbar.setFixedHeight(4)
-        self.pbar.setTextVisible(False)
-        self.pbar.setStyleSheet(f"""
-            QProgressBar {{ 
-                border: none; 
-                background: #2a2a2a; 
-                border-radius: 2px; 
-            }}
-            QProgressBar::chunk {{ 
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {COLOR_ACCENT}, stop:1 #FF6666);
-                border-radius: 2px; 
-            }}
-        """)
-        
-        vbox.addWidget(self.title_lbl)
-        vbox.addWidget(self.status_lbl)
-        vbox.addWidget(self.pbar)
-        
-        layout.addLayout(vbox, 1)
-    
-    def _load_thumbnail(self, url):
-        """Load thumbnail in background thread"""
-        self.thumbnail_loader = ThumbnailLoader(self.item_id, url)
-        self.thumbnail_loader.thumbnail_loaded.connect(self._on_thumbnail_loaded)
-        self.thumbnail_loader.start()
-    
-    @Slot(str, QPixmap)
-    def _on_thumbnail_loaded(self, item_id, pixmap):
-        """Called when thumbnail is loaded"""
-        if item_id == self.item_id and not pixmap.isNull():
-            # Create rounded pixmap
-            rounded = QPixmap(60, 60)
-            rounded.fill(Qt.transparent)
-            
-            painter = QPainter(rounded)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setBrush(QBrush(pixmap))
-            painter.setPen(Qt.NoPen)
-            painter.drawRoundedRect(0, 0, 60, 60, 8, 8)
-            painter.end()
-            
-            self.thumb_label.setPixmap(rounded)
-            self.thumb_label.setStyleSheet("background: transparent; border-radius: 8px;")
+class ThumbnailCacheSweep(QRunnable):
+    """Trim the thumbnail cache to THUMB_CACHE_LIMIT, oldest use first"""
+    
+    def __init__(self, cache_dir):
+        super().__init__()
+        self.cache_dir = cache_dir
+        self.setAutoDelete(True)
+    
+    def run(self):
+        try:
+            files = [(p.stat(), p) for p in self.cache_dir.glob("*.png")]
+        except OSError:
+            return
+        total = sum(st.st_size for st, _ in files)
+        # Hits touch the file, so mtime is the last use
+        for st, path in sorted(files, key=lambda f: f[0].st_mtime):
+            if total <= THUMB_CACHE_LIMIT:
+                break
+            try:
+                path.unlink()
+                total -= st.st_size
+            except OSError:
+                pass
 
-    def set_thumbnail(self, thumbnail_url):
-        """Set thumbnail from URL"""
-        if thumbnail_url:
-            self._load_thumbnail(thumbnail_url)
+class ThumbnailService:
+    """Runs thumbnail jobs on one bounded pool instead of a thread per row"""
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(8)
+        self.cache_dir = Path(QStandardPaths.writableLocation(QStandardPaths.CacheLocation)) / "thumbnails"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.pool.start(ThumbnailCacheSweep(self.cache_dir))
+    
+    def fetch(self, item_id, url, callback):
+        cache_path = self.cache_dir / f"{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}.png"
+        if cache_path.exists():
+            image = QImage(str(cache_path))
+            if not image.isNull():
+                try:
+                    os.utime(cache_path)  # Mark as recently used
+                except OSError:
+                    pass
+                # Deliver after the row finishes constructing, like a network result
+                QTimer.singleShot(0, lambda: callback(item_id, image))
+                return
+        
+        job = ThumbnailJob(item_id, url, cache_path)
+        job.signals.thumbnail_loaded.connect(callback)
+        self.pool.start(job)
 
-    def update_progress(self, progress, status):
-        self.pbar.setValue(int(progress))
-        self.status_lbl.setText(status)
-        
-        # Only show download icon if no thumbnail loaded yet
-        if "downloading" in status.lower() or progress > 0:
-            if self.thumb_label.pixmap() is None or self.thumb_label.pixmap().isNull():
-                self.thumb_label.setText("⬇")
+class ActiveQueueModel(QAbstractListModel):
+    """Active download rows, newest first; painted by ActivityDelegate"""
+    # Rows are stored oldest first so a key's position never shifts on insert
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+        self._index: Dict[str, int] = {}
+    
+    def __contains__(self, key):
+        return key in self._index
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[len(self._rows) - 1 - index.row()]
+        if role == Qt.UserRole:
+            return row
+        if role == Qt.DisplayRole:
+            return row['title']
+        return None
+    
+    def add_rows(self, entries):
+        """Insert (key, title, status) rows at the top in one batch"""
+        entries = [e for e in entries if e[0] not in self._index]
+        if not entries:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(entries) - 1)
+        for key, title, status in entries:
+            self._index[key] = len(self._rows)
+            self._rows.append({
+                'key': key, 'title': title, 'status': status, 'progress': 0,
+                'state': 'pending', 'thumb': None, 'thumb_url': "", 'updated_ns': 0,
+            })
+        self.endInsertRows()
+    
+    def rekey(self, old, new):
+        """Hand a pending row (keyed by URL) its real item id"""
+        pos = self._index.pop(old, None)
+        if pos is None:
+            return False
+        self._index[new] = pos
+        self._rows[pos]['key'] = new
+        return True
+    
+    def row(self, key):
+        pos = self._index.get(key)
+        return None if pos is None else self._rows[pos]
+    
+    def update(self, key, **fields):
+        pos = self._index.get(key)
+        if pos is None:
+            return
+        self._rows[pos].update(fields)
+        self._emit_row(pos)
+    
+    def update_progress(self, key, progress, status):
+        pos = self._index.get(key)
+        if pos is None:
+            return
+        row = self._rows[pos]
+        if row['state'] in ('done', 'failed'):
+            return
+        # Same percent and text would repaint an identical row
+        if int(progress) == int(row['progress']) and status == row['status']:
+            return
+        now = time.monotonic_ns()
+        if progress < 100 and now - row['updated_ns'] < ROW_UPDATE_INTERVAL_NS:
+            return
+        row.update(progress=progress, status=status, state='progress', updated_ns=now)
+        self._emit_row(pos)
+    
+    def set_completed(self, key):
+        self.update(key, progress=100, status="✓ Completed", state='done')
+    
+    def set_failed(self, key):
+        self.update(key, status="✗ Failed", state='failed')
+    
+    def remove_finished(self):
+        """Drop completed/failed rows; rows still downloading stay"""
+        self.beginResetModel()
+        self._rows = [r for r in self._rows if r['state'] not in ('done', 'failed')]
+        self._index = {r['key']: i for i, r in enumerate(self._rows)}
+        self.endResetModel()
+    
+    def _emit_row(self, pos):
+        idx = self.index(len(self._rows) - 1 - pos)
+        self.dataChanged.emit(idx, idx)
+
+class ActivityDelegate(QStyledItemDelegate):
+    """Paints a queue row: thumbnail, title, status and a thin progress bar"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._title_font = QFont()
+        self._title_font.setPixelSize(13)
+        self._title_font.setWeight(QFont.DemiBold)
+        self._title_metrics = QFontMetrics(self._title_font)
+        self._status_font = QFont()
+        self._status_font.setPixelSize(11)
+        self._status_font_bold = QFont(self._status_font)
+        self._status_font_bold.setBold(True)
+        self._glyph_font = QFont()
+        self._glyph_font.setPixelSize(24)
+        # Gradients in object coordinates fit whatever rect they fill
+        thumb_gradient = QLinearGradient(0, 0, 1, 1)
+        thumb_gradient.setCoordinateMode(QGradient.ObjectMode)
+        thumb_gradient.setColorAt(0, QColor("#1a1a1a"))
+        thumb_gradient.setColorAt(1, QColor("#2a2a2a"))
+        self._thumb_brush = QBrush(thumb_gradient)
+        bar_gradient = QLinearGradient(0, 0, 1, 0)
+        bar_gradient.setCoordinateMode(QGradient.ObjectMode)
+        bar_gradient.setColorAt(0, QColor(COLOR_ACCENT))
+        bar_gradient.setColorAt(1, QColor("#FF6666"))
+        self._bar_brush = QBrush(bar_gradient)
+        self._colors = {
+            'surface': QColor(COLOR_SURFACE), 'track': QColor("#2a2a2a"),
+            'accent': QColor(COLOR_ACCENT), 'head': QColor(COLOR_TEXT_HEAD),
+            'body': QColor(COLOR_TEXT_BODY), 'done': QColor(COLOR_SUCCESS),
+            'failed': QColor(COLOR_ERROR),
+        }
+        self._outlines = {}
+        for state in ('done', 'failed'):
+            pen = QPen(self._colors[state])
+            pen.setWidth(2)
+            self._outlines[state] = pen
+    
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), QUEUE_ROW_HEIGHT + QUEUE_ROW_SPACING)
+    
+    def paint(self, painter, option, index):
+        row = index.data(Qt.UserRole)
+        if row is None:
+            return
+        c = self._colors
+        state = row['state']
         
-        if progress >= 100:
-            # Keep thumbnail, just add green border/glow effect
-            if self.thumb_label.pixmap() is None or self.thumb_label.pixmap().isNull():
-                self.thumb_label.setText("✓")
-            
-            # Add green border to indicate success (keeps thumbnail visible)
-            self.thumb_container.setStyleSheet(f"""
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #1a1a1a, stop:1 #2a2a2a);
-                border: 2px solid {COLOR_SUCCESS};
-                border-radius: 10px;
-            """)
-            self.status_lbl.setText("✓ Completed")
-            self.status_lbl.setStyleSheet(f"color: {COLOR_SUCCESS}; font-size: 11px; background: transparent; font-weight: bold;")
-            self.pbar.setStyleSheet(f"""
-                QProgressBar {{ 
-                    border: none; 
-                    background: #2a2a2a; 
-                    border-radius: 2px; 
-                }}
-                QProgressBar::chunk {{ 
-                    background: {COLOR_SUCCESS};
-                    border-radius: 2px; 
-                }}
-            """)
-    
-    def set_failed(self):
-        # Keep thumbnail, just add red border
-        if self.thumb_label.pixmap() is None or self.thumb_label.pixmap().isNull():
-            self.thumb_label.setText("✗")
-        
-        self.thumb_container.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #1a1a1a, stop:1 #2a2a2a);
-            border: 2px solid {COLOR_ERROR};
-            border-radius: 10px;
-        """)
-        self.status_lbl.setText("✗ Failed")
-        self.status_lbl.setStyleSheet(f"color: {COLOR_ERROR}; font-size: 11px; background: transparent;")
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = QRect(option.rect.left(), option.rect.top(), option.rect.width(), QUEUE_ROW_HEIGHT)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(c['surface'])
+        painter.drawRoundedRect(rect, 14, 14)
+        
+        # Thumbnail box, outlined once the download has finished
+        thumb_rect = QRect(rect.left() + 12, rect.top() + 10, 65, 65)
+        painter.setPen(self._outlines.get(state, Qt.NoPen))
+        painter.setBrush(self._thumb_brush)
+        painter.drawRoundedRect(thumb_rect, 10, 10)
+        if row['thumb'] is not None:
+            painter.drawPixmap(thumb_rect.left() + 2, thumb_rect.top() + 2, row['thumb'])
+        else:
+            glyph = {'done': "✓", 'failed': "✗"}.get(
+                state, "⬇" if state == 'progress' and row['progress'] > 0 else "⏳")
+            painter.setPen(c['accent'])
+            painter.setFont(self._glyph_font)
+            painter.drawText(thumb_rect, Qt.AlignCenter, glyph)
+        
+        # Title, status and progress bar
+        x = thumb_rect.right() + 13
+        width = rect.right() - 14 - x
+        painter.setPen(c['head'])
+        painter.setFont(self._title_font)
+        painter.drawText(QRect(x, rect.top() + 14, width, 18), Qt.AlignLeft | Qt.AlignVCenter,
+                         self._title_metrics.elidedText(row['title'], Qt.ElideRight, width))
+        
+        painter.setPen(c[state] if state in ('done', 'failed') else c['body'])
+        painter.setFont(self._status_font_bold if state == 'done' else self._status_font)
+        painter.drawText(QRect(x, rect.top() + 36, width, 16), Qt.AlignLeft | Qt.AlignVCenter, row['status'])
+        
+        bar = QRect(x, rect.top() + 62, width, 4)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(c['track'])
+        painter.drawRoundedRect(bar, 2, 2)
+        filled = int(width * min(row['progress'], 100) / 100)
+        if filled > 0:
+            painter.setBrush(c['done'] if state == 'done' else self._bar_brush)
+            painter.drawRoundedRect(QRect(bar.left(), bar.top(), filled, 4), 2, 2)
+        painter.restore()
+
+class HistoryListModel(QAbstractListModel):
+    """History rows read straight from a bounded deque; text is built on paint"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = deque(maxlen=HISTORY_LIMIT)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            h = self._rows[index.row()]
+            title = h.get('title', 'Unknown')
+            mode = h.get('mode', 'audio').upper()
+            ts = h.get('timestamp', '')[:16].replace('T', ' ')
+            icon = "✓" if h.get('status', 'completed') == "completed" else "✗"
+            return f"{icon} {title}\n   {mode} • {ts}"
+        return None
+    
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows.clear()
+        self._rows.extend(rows)
+        self.endResetModel()
+    
+    def prepend(self, entry):
+        if len(self._rows) == self._rows.maxlen:
+            last = len(self._rows) - 1
+            self.beginRemoveRows(QModelIndex(), last, last)
+            self._rows.pop()
+            self.endRemoveRows()
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.appendleft(entry)
+        self.endInsertRows()
 
 # --- MAIN APP ---
 
@@ -416,10 +597,17 @@ class MobileWindow(QMainWindow):
             self.output_dir = str(Path.home() / "output") # Fallback
         
         self.manager = DownloadManager(output_dir=self.output_dir)
+        self.manager.set_worker_count(MOBILE_WORKERS)
         self._connect_signals()
-        self.active_widgets: Dict[str, ActivityRow] = {}
+        QPixmapCache.setCacheLimit(THUMB_PIXMAP_CACHE_KB)
+        self.queue_model = ActiveQueueModel(self)
         self.pending_urls: List[str] = []  # URLs waiting to be processed
         
+        self._last_scan = ("", [])  # (text, links) of the last input scanned
+        self._text_debounce = QTimer(self)
+        self._text_debounce.setSingleShot(True)
+        self._text_debounce.timeout.connect(self._recount_urls)
+        
         # UI Init
         self.setStyleSheet(GLOBAL_STYLES)
         self._setup_ui()
@@ -429,8 +617,9 @@ class MobileWindow(QMainWindow):
         
     def _connect_signals(self):
         self.manager.signals.download_started.connect(self._on_start)
-        self.manager.signals.progress_updated.connect(self._on_progress)
+        self.manager.signals.progress_batch.connect(self._on_progress_batch)
         self.manager.signals.download_completed.connect(self._on_complete)
+        self.manager.signals.history_entry_added.connect(self._on_history_entry)
         self.manager.signals.download_failed.connect(self._on_fail)
 
     def _setup_ui(self):
@@ -447,13 +636,10 @@ class MobileWindow(QMainWindow):
         self.home_page = self._create_home_page()
         self.page_stack.addWidget(self.home_page)
         
-        # 2. HISTORY PAGE
-        self.history_page = self._create_history_page()
-        self.page_stack.addWidget(self.history_page)
-        
-        # 3. SETTINGS PAGE
-        self.settings_page = self._create_settings_page()
-        self.page_stack.addWidget(self.settings_page)
+        # 2. HISTORY / 3. SETTINGS PAGES - stubs until first visit
+        self._page_builders = {1: self._create_history_page, 2: self._create_settings_page}
+        for _ in self._page_builders:
+            self.page_stack.addWidget(QWidget())
         
         main_layout.addWidget(self.page_stack, 1)
         
@@ -501,15 +687,23 @@ class MobileWindow(QMainWindow):
         return nav
     
     def _switch_page(self, index):
+        self._ensure_page_built(index)
         self.page_stack.setCurrentIndex(index)
         
         # Update nav button styles
         for btn in [self.nav_home, self.nav_history, self.nav_settings]:
             btn._update_style()
-        
-        # Refresh history when switching to it
-        if index == 1:
-            self._load_history()
+
+    def _ensure_page_built(self, index):
+        """Swap a page's stub for its real content on first visit"""
+        builder = self._page_builders.pop(index, None)
+        if builder is None:
+            return False
+        stub = self.page_stack.widget(index)
+        self.page_stack.insertWidget(index, builder())
+        self.page_stack.removeWidget(stub)
+        stub.deleteLater()
+        return True
 
     # --- PAGE CREATORS ---
 
@@ -629,18 +823,26 @@ class MobileWindow(QMainWindow):
         
         vbox.addLayout(queue_header)
         
-        # Queue Container
-        self.queue_widget = QWidget()
-        self.queue_layout = QVBoxLayout(self.queue_widget)
-        self.queue_layout.setSpacing(12)
-        self.queue_layout.setContentsMargins(0, 0, 0, 0)
+        # Queue: one view painting every row, sized to its rows so the page scrolls
+        self.queue_view = QListView()
+        self.queue_view.setModel(self.queue_model)
+        self.queue_view.setItemDelegate(ActivityDelegate(self.queue_view))
+        self.queue_view.setUniformItemSizes(True)
+        self.queue_view.setSelectionMode(QListView.NoSelection)
+        self.queue_view.setFocusPolicy(Qt.NoFocus)
+        self.queue_view.setFrameShape(QFrame.NoFrame)
+        self.queue_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.queue_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.queue_model.rowsInserted.connect(self._fit_queue_view)
+        self.queue_model.modelReset.connect(self._fit_queue_view)
+        vbox.addWidget(self.queue_view)
         
         self.empty_queue_lbl = QLabel("No active downloads")
         self.empty_queue_lbl.setStyleSheet(f"color: {COLOR_TEXT_BODY}; font-style: italic; padding: 30px; background: transparent;")
         self.empty_queue_lbl.setAlignment(Qt.AlignCenter)
-        self.queue_layout.addWidget(self.empty_queue_lbl)
+        vbox.addWidget(self.empty_queue_lbl)
+        self._fit_queue_view()
         
-        vbox.addWidget(self.queue_widget)
         vbox.addStretch()
         
         scroll.setWidget(content)
@@ -670,10 +872,19 @@ class MobileWindow(QMainWindow):
         vbox.addLayout(header)
         
         # History List
-        self.hist_list = QListWidget()
-        self.hist_list.setVerticalScrollMode(QListWidget.ScrollPerPixel)
+        self.hist_model = HistoryListModel(self)
+        self.hist_list = QListView()
+        self.hist_list.setModel(self.hist_model)
+        self.hist_list.setUniformItemSizes(True)
+        self.hist_list.setLayoutMode(QListView.Batched)
+        self.hist_list.setVerticalScrollMode(QListView.ScrollPerPixel)
         vbox.addWidget(self.hist_list, 1)
         
+        self.empty_hist_lbl = QLabel("No download history yet")
+        self.empty_hist_lbl.setStyleSheet(f"color: {COLOR_TEXT_BODY}; font-style: italic; padding: 30px; background: transparent;")
+        self.empty_hist_lbl.setAlignment(Qt.AlignCenter)
+        vbox.addWidget(self.empty_hist_lbl)
+        
         # Load history initially
         self._load_history()
         return w
@@ -726,7 +937,7 @@ class MobileWindow(QMainWindow):
         
         self.spin_workers = QSpinBox()
         self.spin_workers.setRange(1, 5)
-        self.spin_workers.setValue(3)
+        self.spin_workers.setValue(self.manager.max_workers)
         self.spin_workers.setFixedHeight(50)
         self.spin_workers.valueChanged.connect(lambda v: self.manager.set_worker_count(v))
         card_layout.addWidget(self.spin_workers)
@@ -773,20 +984,30 @@ class MobileWindow(QMainWindow):
             if text:
                 urls = extract_youtube_urls(text)
                 if urls:
-                    self.url_input.setPlainText(text)
+                    # Paste only the links, not a possibly huge clipboard blob
+                    self.url_input.setPlainText("\n".join(urls))
         except Exception as e:
             print(f"Clipboard access error: {e}")
 
     @Slot()
     def _on_text_changed(self):
-        text = self.url_input.toPlainText()
-        urls = extract_youtube_urls(text)
-        count = len(urls)
+        self._text_debounce.start(URL_RECOUNT_DELAY_MS)
+
+    @Slot()
+    def _recount_urls(self):
+        count = len(self._scan_urls())
         if count > 0:
             self.url_count_lbl.setText(f"✓ {count} link{'s' if count > 1 else ''} detected")
         else:
             self.url_count_lbl.setText("")
 
+    def _scan_urls(self):
+        """Links in the input box, reusing the last scan if the text is unchanged"""
+        text = self.url_input.toPlainText()
+        if text != self._last_scan[0]:
+            self._last_scan = (text, extract_youtube_urls(text))
+        return self._last_scan[1]
+
     @Slot(bool)
     def _on_mode_change(self, is_video):
         self.format_combo.clear()
@@ -797,26 +1018,21 @@ class MobileWindow(QMainWindow):
 
     @Slot()
     def _start_download(self):
-        text = self.url_input.toPlainText().strip()
-        if not text:
+        urls = self._scan_urls()
+        if not urls and not self._last_scan[0].strip():
             QMessageBox.warning(self, "No Input", "Please paste YouTube URLs first.")
             return
             
-        urls = extract_youtube_urls(text)
         if not urls:
             QMessageBox.warning(self, "No URLs", "No valid YouTube links found in the text.")
             return
         
-        # INSTANT FEEDBACK: Create pending entries immediately
-        self.empty_queue_lbl.hide()
+        # INSTANT FEEDBACK: Create pending entries immediately, in one batch.
+        # Keyed by URL until _on_start hands the row its real item id.
         self.pending_urls = urls.copy()
-        
-        for i, url in enumerate(urls):
-            # Create immediate visual feedback with "Preparing..." status
-            temp_id = f"pending_{hash(url)}_{i}"
-            row = ActivityRow(temp_id, f"Preparing: {url[:50]}...", "Connecting...")
-            self.active_widgets[temp_id] = row
-            self.queue_layout.insertWidget(0, row)
+        self.queue_model.add_rows(
+            (url, f"Preparing: {url[:50]}...", "Connecting...") for url in urls
+        )
         
         # Disable button during processing
         self.download_btn.set_loading(True)
@@ -825,12 +1041,7 @@ class MobileWindow(QMainWindow):
         mode = DownloadMode.VIDEO if self.video_btn.isChecked() else DownloadMode.AUDIO
         fmt = self.format_combo.currentText().lower()
         
-        self.manager.set_worker_count(self.spin_workers.value())
-        
-        for url in urls:
-            self.manager.add_url(url, mode, "best", 0, fmt)
-        
-        self.manager.start()
+        self.manager.add_urls(urls, mode, "best", 0, fmt)
         
         # Clear input after adding to queue
         self.url_input.clear()
@@ -844,26 +1055,17 @@ class MobileWindow(QMainWindow):
         self.download_btn.setText("⬇  DOWNLOAD")
 
     def _load_history(self):
-        self.hist_list.clear()
         history = self.manager.get_history()
-        
-        if not history:
-            item = QListWidgetItem("No download history yet")
-            item.setFlags(item.flags() & ~Qt.ItemIsSelectable)
-            self.hist_list.addItem(item)
-            return
-        
-        for h in history:
-            title = h.get('title', 'Unknown')
-            mode = h.get('mode', 'audio').upper()
-            ts = h.get('timestamp', '')[:16].replace('T', ' ')
-            status = h.get('status', 'completed')
-            
-            icon = "✓" if status == "completed" else "✗"
-            color = COLOR_SUCCESS if status == "completed" else COLOR_ERROR
-            
-            item = QListWidgetItem(f"{icon} {title}\n   {mode} • {ts}")
-            self.hist_list.addItem(item)
+        self.hist_model.set_rows(history)
+        self.empty_hist_lbl.setVisible(not history)
+
+    @Slot(dict)
+    def _on_history_entry(self, entry):
+        """Prepend one finished download instead of re-reading all history"""
+        if 1 in self._page_builders:
+            return  # Page not built yet; it loads everything when opened
+        self.hist_model.prepend(entry)
+        self.empty_hist_lbl.hide()
 
     def _browse_path(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Download Folder", self.output_dir)
@@ -871,13 +1073,46 @@ class MobileWindow(QMainWindow):
             self.output_dir = folder
             self.path_input.setText(folder)
             self.manager.set_output_dir(folder)
+            if 1 not in self._page_builders:
+                self._load_history()  # Each folder has its own history.json
 
     def _clear_queue(self):
-        for item_id, widget in list(self.active_widgets.items()):
-            widget.setParent(None)
-            widget.deleteLater()
-        self.active_widgets.clear()
-        self.empty_queue_lbl.show()
+        """Remove finished rows; rows still downloading stay visible"""
+        self.queue_model.remove_finished()
+
+    def _fit_queue_view(self):
+        rows = self.queue_model.rowCount()
+        self.queue_view.setFixedHeight(rows * (QUEUE_ROW_HEIGHT + QUEUE_ROW_SPACING))
+        self.queue_view.setVisible(rows > 0)
+        self.empty_queue_lbl.setVisible(rows == 0)
+
+    def _load_thumbnail(self, item_id, url):
+        self.queue_model.update(item_id, thumb_url=url)
+        cached = QPixmapCache.find(url)
+        if cached is not None and not cached.isNull():
+            self.queue_model.update(item_id, thumb=cached)
+            return
+        ThumbnailService.instance().fetch(item_id, url, self._on_thumbnail_loaded)
+
+    @Slot(str, QImage)
+    def _on_thumbnail_loaded(self, item_id, image):
+        """Round a fetched thumbnail once, then share it through QPixmapCache"""
+        row = self.queue_model.row(item_id)
+        if row is None or image.isNull():
+            return
+        pixmap = QPixmap.fromImage(image)
+        rounded = QPixmap(60, 60)
+        rounded.fill(Qt.transparent)
+        
+        painter = QPainter(rounded)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(QBrush(pixmap))
+        painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(0, 0, 60, 60, 8, 8)
+        painter.end()
+        
+        QPixmapCache.insert(row['thumb_url'], rounded)
+        self.queue_model.update(item_id, thumb=rounded)
 
     # --- DOWNLOAD SIGNALS ---
 
@@ -885,37 +1120,30 @@ class MobileWindow(QMainWindow):
     def _on_start(self, item_id, title, thumbnail_url):
         print(f"Download started: {title}")
         
-        # Remove pending placeholder entries
-        pending_to_remove = [k for k in self.active_widgets.keys() if k.startswith("pending_")]
-        for pid in pending_to_remove:
-            if pid in self.active_widgets:
-                widget = self.active_widgets.pop(pid)
-                widget.setParent(None)
-                widget.deleteLater()
-        
-        self.empty_queue_lbl.hide()
+        if item_id in self.queue_model:
+            return
         
-        # Add real download entry with thumbnail
-        if item_id not in self.active_widgets:
-            row = ActivityRow(item_id, title, "Starting download...", thumbnail_url)
-            self.active_widgets[item_id] = row
-            self.queue_layout.insertWidget(0, row)
+        # Promote the pending row for this URL in place
+        item = self.manager.items.get(item_id)
+        if item and self.queue_model.rekey(item.url, item_id):
+            self.queue_model.update(item_id, title=title, status="Starting download...")
+        else:
+            self.queue_model.add_rows([(item_id, title, "Starting download...")])
+        if thumbnail_url:
+            self._load_thumbnail(item_id, thumbnail_url)
 
-    @Slot(str, float, str)
-    def _on_progress(self, item_id, progress, status):
-        if item_id in self.active_widgets:
-            self.active_widgets[item_id].update_progress(progress, status)
+    @Slot(list)
+    def _on_progress_batch(self, updates):
+        for item_id, progress, status in updates:
+            self.queue_model.update_progress(item_id, progress, status)
 
     @Slot(str, str, str)
     def _on_complete(self, item_id, title, path):
-        if item_id in self.active_widgets:
-            self.active_widgets[item_id].update_progress(100, "Completed")
-        self._load_history()
+        self.queue_model.set_completed(item_id)
 
     @Slot(str, str, str)
     def _on_fail(self, item_id, title, error):
-        if item_id in self.active_widgets:
-            self.active_widgets[item_id].set_failed()
+        self.queue_model.set_failed(item_id)
 
     def closeEvent(self, event):
         self.manager.stop()
@@ -9,28 +9,28 @@ To build the actual APK, use: python scripts/build_android.py
 
 import os
 import sys
-import subprocess
+import runpy
 
 def main():
     # Get project root
     project_root = os.path.dirname(os.path.abspath(__file__))
     
-    # Activate virtual environment if it exists
-    venv_python = os.path.join(project_root, "venv", "bin", "python")
-    if os.path.exists(venv_python):
-        python_exe = venv_python
-    else:
-        python_exe = sys.executable
+    # Switch to the virtual environment if it exists and isn't active yet
+    venv_dir = os.path.join(project_root, "venv")
+    venv_python = os.path.join(venv_dir, "bin", "python")
+    if os.path.exists(venv_python) and os.path.realpath(sys.prefix) != os.path.realpath(venv_dir):
+        os.execv(venv_python, [venv_python, os.path.abspath(__file__)] + sys.argv[1:])
     
-    # Run the mobile app
+    # Run the mobile app in this interpreter rather than a child process
     mobile_main = os.path.join(project_root, "src", "mobile", "main.py")
-    
-    if os.path.exists(mobile_main):
-        subprocess.run([python_exe, mobile_main], cwd=project_root)
-    else:
+    if not os.path.exists(mobile_main):
         # Fallback to old structure
-        old_main = os.path.join(project_root, "src", "mobile_main.py")
-        subprocess.run([python_exe, old_main], cwd=project_root)
+        mobile_main = os.path.join(project_root, "src", "mobile_main.py")
+    
+    os.chdir(project_root)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    runpy.run_path(mobile_main, run_name="__main__")
 
 
 if __name__ == "__main__":
@@ -28,12 +28,15 @@ def main():
         if current_exe != target_exe:
             print(f"🔄 Switching to virtual environment: {target_exe}")
             # Re-execute this script with the venv python
+            args = [str(target_exe), str(project_root / "run.py")] + sys.argv[1:]
             try:
-                subprocess.run([str(target_exe), str(project_root / "run.py")] + sys.argv[1:], check=True)
-                return
-            except subprocess.CalledProcessError as e:
-                sys.exit(e.returncode)
-            except FileNotFoundError:
+                if sys.platform == "win32":
+                    # Windows execv doesn't quote arguments; keep a child process
+                    sys.exit(subprocess.run(args).returncode)
+                # Replace this process instead of waiting on a child interpreter
+                sys.stdout.flush()
+                os.execv(args[0], args)
+            except OSError:
                 print(f"❌ Error: Python executable not found at {target_exe}")
                 print("   Please ensure virtual environment is created correctly.")
                 sys.exit(1)
@@ -0,0 +1,68 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec for the macOS desktop app (run via scripts/build_macos.py).
+# Kept in the repo so builds skip makespec and reuse build/'s analysis cache.
+import sys
+from pathlib import Path
+
+sys.path.insert(0, SPECPATH)
+from build_common import EXCLUDE_MODULES
+
+project_root = Path(SPECPATH).parent
+icon_path = project_root / "assets" / "icon.png"
+
+a = Analysis(
+    [str(project_root / "src" / "desktop" / "main.py")],
+    pathex=[str(project_root)],
+    binaries=[],
+    datas=[(str(project_root / "assets"), "assets")],
+    hiddenimports=[
+        "PySide6",
+        "yt_dlp",
+        "yt_dlp.extractor.youtube",
+        "yt_dlp.extractor.common",
+        "requests",
+        "orjson",
+    ],
+    # Targeted yt_dlp collection instead of --collect-all (see hooks/)
+    hookspath=[str(project_root / "scripts" / "hooks")],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=EXCLUDE_MODULES,
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name="YouTube Downloader Pro",
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    console=False,  # No terminal
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=[str(icon_path)] if icon_path.exists() else None,
+)
+# Folder bundle (faster start than onefile)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name="YouTube Downloader Pro",
+)
+app = BUNDLE(
+    coll,
+    name="YouTube Downloader Pro.app",
+    icon=str(icon_path) if icon_path.exists() else None,
+    bundle_identifier=None,
+)
@@ -0,0 +1,60 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec for the Windows desktop app (run via scripts/build_windows.py).
+# Kept in the repo so builds skip makespec and reuse build/'s analysis cache.
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, SPECPATH)
+from build_common import EXCLUDE_MODULES
+
+project_root = Path(SPECPATH).parent
+
+# Folder bundle by default: onefile re-extracts everything to %TEMP%
+# on every launch. PYINSTALLER_BUILD_ONEFILE=yes restores a single .exe
+onefile = os.environ.get("PYINSTALLER_BUILD_ONEFILE", "").lower() in ("1", "yes", "true")
+
+# .ico is preferred for Windows, fall back to the png
+icon_path = project_root / "assets" / "icon.ico"
+if not icon_path.exists():
+    icon_path = project_root / "assets" / "icon.png"
+
+a = Analysis(
+    [str(project_root / "src" / "desktop" / "main.py")],
+    pathex=[str(project_root)],
+    binaries=[],
+    datas=[(str(project_root / "assets"), "assets")],
+    hiddenimports=["PySide6", "yt_dlp", "requests", "orjson"],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=EXCLUDE_MODULES,
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+
+exe_options = dict(
+    name="YouTubeDownloaderPro",
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    console=False,  # No console window
+    disable_windowed_traceback=False,
+    icon=[str(icon_path)] if icon_path.exists() else None,
+)
+
+if onefile:
+    exe = EXE(pyz, a.scripts, a.binaries, a.datas, [],
+              runtime_tmpdir=None, upx_exclude=[], **exe_options)
+else:
+    exe = EXE(pyz, a.scripts, [], exclude_binaries=True, **exe_options)
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=False,
+        upx=True,
+        upx_exclude=[],
+        name="YouTubeDownloaderPro",
+    )
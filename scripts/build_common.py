@@ -0,0 +1,109 @@
+"""
+Shared PyInstaller settings for the desktop build scripts
+"""
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+# Modules the desktop app never imports. PyInstaller drops them while
+# building the module graph, so their hooks never run either.
+EXCLUDE_MODULES = [
+    # Heavy third-party packages that may be installed alongside
+    "tkinter",
+    "matplotlib",
+    "scipy",
+    "numpy",
+    "pandas",
+    
+    # Qt modules (the app only uses QtCore, QtGui, QtWidgets and QtNetwork)
+    "PySide6.QtQuick",
+    "PySide6.QtQml",
+    "PySide6.Qt3DCore",
+    "PySide6.QtWebEngineCore",
+    "PySide6.QtWebSockets",
+    "PySide6.QtMultimedia",
+    "PySide6.QtCharts",
+    "PySide6.QtDataVisualization",
+    "PySide6.QtSensors",
+    "PySide6.QtTest",
+    "PySide6.QtPrintSupport",
+    "PySide6.QtSvg",
+    "PySide6.QtOpenGL",
+    "PySide6.QtOpenGLWidgets",
+    "PySide6.QtPdf",
+    "PySide6.QtPositioning",
+    "PySide6.QtBluetooth",
+    "PySide6.QtNfc",
+    "PySide6.QtSerialPort",
+    
+    # Standard library tooling
+    "pydoc",
+    "doctest",
+    "unittest",
+    "test",
+    "xmlrpc",
+    "lib2to3",
+    "turtle",
+    "idlelib",
+    "distutils",
+]
+
+# Directories inside the bundle that are never loaded at runtime
+STRIP_DIRS = {"__pycache__", "tests", "test", "_test"}
+
+# File suffixes only used by tooling (type stubs)
+STRIP_SUFFIXES = {".pyi"}
+
+
+def _is_unused_translation(path):
+    """Qt translation files other than English."""
+    return (path.parent.name == "translations" and "PySide6" in path.parts
+            and path.suffix == ".qm" and not path.name.split("_")[-1].startswith("en"))
+
+
+def strip_bundle(dist_dir):
+    """Delete files from a finished bundle that the app never uses.
+    
+    Returns the number of bytes freed.
+    """
+    freed = 0
+    for root, dirs, files in os.walk(dist_dir):
+        root = Path(root)
+        for name in [d for d in dirs if d in STRIP_DIRS]:
+            path = root / name
+            if not path.is_symlink():
+                freed += sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+                shutil.rmtree(path, ignore_errors=True)
+            dirs.remove(name)
+        for name in files:
+            path = root / name
+            if path.is_symlink():
+                continue
+            if (path.suffix in STRIP_SUFFIXES
+                    or (name == "RECORD" and root.name.endswith(".dist-info"))
+                    or _is_unused_translation(path)):
+                freed += path.stat().st_size
+                path.unlink()
+    return freed
+
+
+def compile_resources(project_root):
+    """Compile assets/resources.qrc into src/resources_rc.py for bundling."""
+    qrc = Path(project_root) / "assets" / "resources.qrc"
+    if not (qrc.parent / "icon.png").exists():
+        print("⚠️ Warning: assets/icon.png not found, skipping Qt resources")
+        return
+    subprocess.check_call([
+        "pyside6-rcc", str(qrc), "-o", str(Path(project_root) / "src" / "resources_rc.py")
+    ])
+
+
+def pyinstaller_env():
+    """Environment for the PyInstaller run.
+    
+    PYTHONOPTIMIZE=1 makes PyInstaller byte-compile the bundled modules at
+    optimization level 1, so only that one variant ships. Modules live in
+    the PYZ archive, which is never checked against source timestamps.
+    """
+    return {**os.environ, "PYTHONOPTIMIZE": "1"}
@@ -2,23 +2,26 @@
 """
 Build script for YouTube Downloader Pro (Desktop) - macOS
 """
+import argparse
 import os
 import shutil
 import subprocess
 import sys
 from pathlib import Path
 
-def build_app():
+from build_common import compile_resources, pyinstaller_env, strip_bundle
+
+def build_app(fresh=False):
     # Setup paths
     project_root = Path(__file__).parent.parent
     dist_dir = project_root / "dist"
     build_dir = project_root / "build"
     
-    # Clean previous builds
-    if dist_dir.exists():
-        shutil.rmtree(dist_dir)
-    if build_dir.exists():
-        shutil.rmtree(build_dir)
+    # Clean previous output (a missing directory is fine). build/ holds
+    # PyInstaller's analysis cache and is only wiped for a fresh build
+    shutil.rmtree(dist_dir, ignore_errors=True)
+    if fresh:
+        shutil.rmtree(build_dir, ignore_errors=True)
         
     print("🚀 Starting PyInstaller Build for Desktop App...")
     
@@ -27,56 +30,29 @@ def build_app():
     if not icon_path.exists():
         print("⚠️ Warning: Icon not found at assets/icon.png")
         
-    # PyInstaller Arguments
+    # Build settings live in the committed spec file
     cmd = [
         "pyinstaller",
-        "--name", "YouTube Downloader Pro",
-        "--windowed",  # No terminal
-        "--onedir",    # Folder bundle (faster start than onddfile)
-        "--clean",
         "--noconfirm",
-        
-        # Icon
-        "--icon", str(icon_path),
-        
-        # Data
-        f"--add-data={project_root}/assets:assets",
-        
-        # Hidden Imports (Critical)
-        "--hidden-import", "PySide6",
-        "--hidden-import", "yt_dlp",
-        "--hidden-import", "yt_dlp.extractor.youtube",
-        "--hidden-import", "yt_dlp.extractor.common",
-        "--hidden-import", "requests",
-        
-        # Collect all of yt_dlp to be safe
-        "--collect-all", "yt_dlp",
-        
-        # Optimization: Exclude unnecessary heavy modules
-        "--exclude-module", "tkinter",
-        "--exclude-module", "matplotlib",
-        "--exclude-module", "scipy",
-        "--exclude-module", "numpy",
-        "--exclude-module", "pandas",
-        "--exclude-module", "PySide6.QtQuick",
-        "--exclude-module", "PySide6.QtQml",
-        "--exclude-module", "PySide6.Qt3DCore",
-        "--exclude-module", "PySide6.QtWebEngineCore",
-        "--exclude-module", "PySide6.QtWebSockets",
-        "--exclude-module", "PySide6.QtMultimedia",
-        "--exclude-module", "PySide6.QtCharts",
-        "--exclude-module", "PySide6.QtDataVisualization",
-        "--exclude-module", "PySide6.QtSensors",
-        "--exclude-module", "PySide6.QtTest",
-        
-        # Entry Point
-        str(project_root / "src/desktop/main.py")
+        str(project_root / "scripts" / "YouTubeDownloaderPro-macos.spec"),
     ]
     
+    if fresh:
+        cmd.insert(1, "--clean")
+    
     print(f"Running command: {' '.join(cmd)}")
     
     try:
-        subprocess.check_call(cmd, cwd=project_root)
+        compile_resources(project_root)
+        subprocess.check_call(cmd, cwd=project_root, env=pyinstaller_env())
+        
+        app_path = dist_dir / "YouTube Downloader Pro.app"
+        freed = strip_bundle(dist_dir)
+        print(f"🧹 Removed {freed / 1024 / 1024:.1f} MB of unused files from the bundle")
+        # Stripping invalidates PyInstaller's ad-hoc signature; re-sign so
+        # the app still launches on Apple Silicon
+        subprocess.check_call(["codesign", "--force", "--deep", "--sign", "-", str(app_path)])
+        
         print("\n✅ Build complete!")
         print(f"📂 App located at: {dist_dir}/YouTube Downloader Pro.app")
         print("To run: open 'dist/YouTube Downloader Pro.app'")
@@ -85,4 +61,7 @@ def build_app():
         sys.exit(1)
 
 if __name__ == "__main__":
-    build_app()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fresh", action="store_true",
+                        help="discard PyInstaller's cache and rebuild everything")
+    build_app(fresh=parser.parse_args().fresh)
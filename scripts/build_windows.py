@@ -1,11 +1,14 @@
 
+import argparse
 import os
 import shutil
 import subprocess
 import sys
 from pathlib import Path
 
-def build_windows():
+from build_common import compile_resources, pyinstaller_env, strip_bundle
+
+def build_windows(fresh=False):
     """Build script for Windows EXE using PyInstaller"""
     
     if sys.platform != "win32":
@@ -18,14 +21,18 @@ def build_windows():
     dist_dir = project_root / "dist"
     build_dir = project_root / "build"
     
-    # Clean previous builds
-    if dist_dir.exists():
-        shutil.rmtree(dist_dir)
-    if build_dir.exists():
-        shutil.rmtree(build_dir)
+    # Clean previous output (a missing directory is fine). build/ holds
+    # PyInstaller's analysis cache and is only wiped for a fresh build
+    shutil.rmtree(dist_dir, ignore_errors=True)
+    if fresh:
+        shutil.rmtree(build_dir, ignore_errors=True)
         
     print("🚀 Starting PyInstaller Build for Windows...")
     
+    # Folder bundle by default, PYINSTALLER_BUILD_ONEFILE=yes restores a
+    # single .exe (the spec file reads the same variable)
+    onefile = os.environ.get("PYINSTALLER_BUILD_ONEFILE", "").lower() in ("1", "yes", "true")
+    
     # Check for icon
     icon_path = project_root / "assets" / "icon.ico"
     if not icon_path.exists():
@@ -34,56 +41,37 @@ def build_windows():
         if not icon_path.exists():
             print("⚠️ Warning: Icon not found")
         
-    # PyInstaller Arguments
+    # Build settings live in the committed spec file
     cmd = [
         "pyinstaller",
-        "--name", "YouTubeDownloaderPro",
-        "--windowed",      # No console window
-        "--onefile",       # Single .exe file!
-        "--clean",
         "--noconfirm",
-        
-        # Icon
-        f"--icon={str(icon_path)}",
-        
-        # Data (Windows uses semicolon separator)
-        f"--add-data={project_root}/assets;assets",
-        
-        # Hidden Imports
-        "--hidden-import", "PySide6",
-        "--hidden-import", "yt_dlp",
-        "--hidden-import", "requests",
-        
-        # Opimization: Exclude unused modules
-        "--exclude-module", "tkinter",
-        "--exclude-module", "matplotlib",
-        "--exclude-module", "scipy",
-        "--exclude-module", "numpy",
-        "--exclude-module", "pandas",
-        "--exclude-module", "PySide6.QtQuick",
-        "--exclude-module", "PySide6.QtQml",
-        "--exclude-module", "PySide6.Qt3DCore",
-        "--exclude-module", "PySide6.QtWebEngineCore",
-        "--exclude-module", "PySide6.QtWebSockets",
-        "--exclude-module", "PySide6.QtMultimedia",
-        "--exclude-module", "PySide6.QtCharts",
-        "--exclude-module", "PySide6.QtDataVisualization",
-        "--exclude-module", "PySide6.QtSensors",
-        "--exclude-module", "PySide6.QtTest",
-        
-        # Entry Point
-        str(project_root / "src/desktop/main.py")
+        str(project_root / "scripts" / "YouTubeDownloaderPro-windows.spec"),
     ]
     
+    if fresh:
+        cmd.insert(1, "--clean")
+    
     print(f"Running command: {' '.join(cmd)}")
     
     try:
-        subprocess.check_call(cmd, cwd=project_root)
+        compile_resources(project_root)
+        subprocess.check_call(cmd, cwd=project_root, env=pyinstaller_env())
+        
+        freed = strip_bundle(dist_dir)
+        print(f"🧹 Removed {freed / 1024 / 1024:.1f} MB of unused files from the bundle")
+        
         print("\n✅ Build complete!")
-        print(f"📂 EXE located at: {dist_dir}\\YouTubeDownloaderPro.exe")
+        if onefile:
+            print(f"📂 EXE located at: {dist_dir}\\YouTubeDownloaderPro.exe")
+        else:
+            print(f"📂 EXE located at: {dist_dir}\\YouTubeDownloaderPro\\YouTubeDownloaderPro.exe")
+            print("   Ship the whole YouTubeDownloaderPro folder (zip or installer)")
     except subprocess.CalledProcessError as e:
         print(f"\n❌ Build failed: {e}")
         input("Press Enter to exit...") # Keep window open on error
 
 if __name__ == "__main__":
-    build_windows()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fresh", action="store_true",
+                        help="discard PyInstaller's cache and rebuild everything")
+    build_windows(fresh=parser.parse_args().fresh)
@@ -0,0 +1,14 @@
+"""
+PyInstaller hook for yt_dlp - collect only what the YouTube flow needs
+"""
+from PyInstaller.utils.hooks import collect_submodules, collect_data_files
+
+# The app only accepts YouTube URLs (see src/core/utils.py), so only the
+# YouTube extractor package plus the shared base extractors are forced in
+hiddenimports = collect_submodules("yt_dlp.extractor.youtube") + [
+    "yt_dlp.extractor.common",
+    "yt_dlp.extractor.generic",
+]
+
+# Non-Python files only; extractor sources are resolved through imports
+datas = collect_data_files("yt_dlp", excludes=["extractor/**"])
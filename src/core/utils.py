@@ -1,5 +1,58 @@
-import re
-from typing import List
+from typing import List, Optional
+
+try:
+    # Optional: google-re2 / pyre2 match in guaranteed linear time
+    import re2 as _re_engine
+except ImportError:
+    import re as _re_engine
+
+# Single pass over the input instead of one findall per URL shape.
+# The pattern avoids backreferences and lookarounds so RE2 accepts it.
+# Case-insensitivity is scoped to the scheme/host/path literals; the
+# character-class tails are case-neutral and don't need folding.
+_YT_URL_RE = _re_engine.compile(
+    r'(?i:https?://)(?:'
+    # Standard watch, playlist and channel URLs
+    r'(?i:(?:www\.)?youtube\.com/(?:watch\?|playlist\?|channel/|c/))[^\s<>"\']+'
+    # Shorts and @handles
+    r'|(?i:(?:www\.)?youtube\.com/shorts/)[a-zA-Z0-9_-]+'
+    r'|(?i:(?:www\.)?youtube\.com/@)[^\s<>"\'/]+'
+    # Short URLs
+    r'|(?i:youtu\.be/)[a-zA-Z0-9_-]+(?:\?[^\s<>"\']*)?'
+    # Music URLs
+    r'|(?i:music\.youtube\.com/watch\?)[^\s<>"\']+'
+    r')'
+)
+
+_TRAILING_PUNCTUATION = '.,;:!?'
+
+# Above this size, jump between "://" hits with str.find instead of
+# letting the regex engine try every character as a match start
+_SCAN_THRESHOLD = 65536
+
+
+def _scan_urls(text: str) -> List[str]:
+    """Find URL matches by anchoring the regex at each scheme separator."""
+    urls = []
+    pos = 0
+    while True:
+        i = text.find('://', pos)
+        if i < 0:
+            break
+        if text[i - 5:i].lower() == 'https':
+            start = i - 5
+        elif text[i - 4:i].lower() == 'http':
+            start = i - 4
+        else:
+            start = -1
+        match = _YT_URL_RE.match(text, start) if start >= pos else None
+        if match:
+            urls.append(match.group())
+            pos = match.end()
+        else:
+            pos = i + 3
+    return urls
+
 
 def extract_youtube_urls(text: str) -> List[str]:
     """
@@ -12,51 +65,46 @@ def extract_youtube_urls(text: str) -> List[str]:
     - youtube.com/@channel
     - youtube.com/channel/
     """
-    patterns = [
-        # Standard watch URLs
-        r'https?://(?:www\.)?youtube\.com/watch\?[^\s<>"\']+',
-        # Short URLs
-        r'https?://youtu\.be/[a-zA-Z0-9_-]+(?:\?[^\s<>"\']*)?',
-        # Playlist URLs
-        r'https?://(?:www\.)?youtube\.com/playlist\?[^\s<>"\']+',
-        # Shorts
-        r'https?://(?:www\.)?youtube\.com/shorts/[a-zA-Z0-9_-]+',
-        # Channel URLs
-        r'https?://(?:www\.)?youtube\.com/@[^\s<>"\'/]+',
-        r'https?://(?:www\.)?youtube\.com/channel/[^\s<>"\']+',
-        r'https?://(?:www\.)?youtube\.com/c/[^\s<>"\']+',
-        # Music URLs
-        r'https?://music\.youtube\.com/watch\?[^\s<>"\']+',
-    ]
+    # Every supported host contains "youtu"; skip the regex scan for
+    # plain text (lower() only runs when the cheap exact check misses).
+    if 'youtu' not in text and 'youtu' not in text.lower():
+        return []
     
-    urls = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        urls.extend(matches)
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_urls = []
-    for url in urls:
-        # Clean URL (remove trailing punctuation)
-        url = url.rstrip('.,;:!?')
-        if url not in seen:
-            seen.add(url)
-            unique_urls.append(url)
-    
-    return unique_urls
+    # Clean URLs (remove trailing punctuation), then drop duplicates
+    # while preserving order. findall + dict.fromkeys measured faster here
+    # than a finditer loop with a seen-set (no match objects, dedup in C)
+    matches = _scan_urls(text) if len(text) > _SCAN_THRESHOLD else _YT_URL_RE.findall(text)
+    return list(dict.fromkeys(
+        url.rstrip(_TRAILING_PUNCTUATION) for url in matches
+    ))
 
 import sys
 import os
 
+# PyInstaller unpacks bundled resources under sys._MEIPASS; in development
+# they live at the project root. Resolved once, independent of the cwd.
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
 def resource_path(relative_path: str) -> str:
     """
     Get absolute path to resource, works for dev and for PyInstaller.
     """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
+    return os.path.join(_BASE_PATH, relative_path)
 
-    return os.path.join(base_path, relative_path)
+try:
+    # Generated from assets/resources.qrc by the build scripts; icons are
+    # then read from memory instead of being looked up on disk
+    from src import resources_rc as _resources_rc
+except ImportError:
+    _resources_rc = None
+
+def icon_path(name: str) -> Optional[str]:
+    """
+    Path for QIcon to a bundled icon, or None if it isn't available.
+    """
+    if _resources_rc is not None:
+        return f":/icons/{name}"
+    path = resource_path(os.path.join("assets", name))
+    return path if os.path.exists(path) else None
@@ -13,18 +13,82 @@ This module provides:
 
 import os
 import json
-import uuid
+import itertools
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Deque
 from dataclasses import dataclass, field
 from enum import Enum
 from queue import Queue
+from collections import deque
 import threading
+import time
+from functools import lru_cache
 
-from PySide6.QtCore import QThread, Signal, QObject, QMutex, QWaitCondition, QRunnable, QThreadPool
-import yt_dlp
+try:
+    # Optional: orjson reads and writes history.json far faster
+    import orjson
+except ImportError:
+    orjson = None
+
+from PySide6.QtCore import QThread, Signal, QObject, QMutex, QWaitCondition, QSemaphore, QRunnable, QThreadPool, QTimer, QCoreApplication
+
+# yt_dlp is imported where it's first used: loading its extractor registry
+# takes hundreds of ms and shouldn't hold up the first window paint
+
+
+# Number of entries kept in history.json
+HISTORY_LIMIT = 50
+# Delay before changed history is written back to disk
+HISTORY_FLUSH_DELAY_MS = 2000
+# Minimum seconds between progress signals for one download
+PROGRESS_EMIT_INTERVAL = 0.15
+# Progress from all workers reaches the UI as one batch per interval (ms)
+PROGRESS_BATCH_INTERVAL_MS = 100
+
+# Downloads are network-bound, so run a few even on small machines
+CPU_COUNT = os.cpu_count() or 2
+DEFAULT_WORKERS = min(8, max(2, CPU_COUNT))
+MAX_WORKERS = max(5, CPU_COUNT)
+# FFmpeg post-processing is CPU-bound; limit how many items run it at once
+POSTPROCESS_SLOTS = max(1, CPU_COUNT // 2)
+
+# Item ids only need to be unique within one run
+_ID_COUNTER = itertools.count(1)
+
+# yt-dlp options shared by every download; copied, then completed per item
+_BASE_YDL_OPTS = {
+    'ignoreerrors': True,
+    'no_warnings': False,
+    'quiet': True,
+    'no_color': True,
+    'socket_timeout': 30,
+    'retries': 10,
+    'prefer_ffmpeg': True,
+}
+_AUDIO_CODECS = {'mp3': 'mp3', 'aac': 'aac', 'wav': 'wav', 'flac': 'flac'}
+_VIDEO_CONTAINERS = ('mp4', 'mkv', 'webm')
+_VIDEO_HEIGHTS = {'1080p': '1080', '720p': '720', '480p': '480', '360p': '360'}
+
+
+def _format_timestamp(ns: int) -> str:
+    """Local ISO 8601 time for a time.time_ns() value."""
+    return datetime.fromtimestamp(ns / 1e9).isoformat(timespec='seconds')
+
+
+def _dump_history(entries: List[Dict[str, Any]]) -> bytes:
+    """Serialize history entries; both backends write the same layout."""
+    if orjson is not None:
+        return orjson.dumps(entries, option=orjson.OPT_INDENT_2)
+    return json.dumps(entries, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _load_history_data(data: bytes) -> List[Dict[str, Any]]:
+    """Parse history.json contents."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class DownloadMode(Enum):
@@ -42,7 +106,7 @@ class DownloadStatus(Enum):
     PAUSED = "paused"
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadItem:
     """Represents a single download task."""
     url: str
@@ -57,20 +121,18 @@ class DownloadItem:
     thumbnail: str = ""  # Thumbnail URL
     error_message: str = ""
     output_path: str = ""
-    item_id: str = field(default_factory=lambda: "")
-    
-    def __post_init__(self):
-        if not self.item_id:
-            self.item_id = f"{hash(self.url + str(datetime.now().timestamp()))}"
+    item_id: str = field(default_factory=lambda: f"dl_{next(_ID_COUNTER)}")
 
 
 class DownloadSignals(QObject):
     """Signals for download worker communication."""
-    progress_updated = Signal(str, float, str)  # item_id, progress, status_text
+    progress_batch = Signal(list)  # [(item_id, progress, status_text), ...]
+    progress_pending = Signal()  # internal: first update since the last batch
     download_started = Signal(str, str, str)  # item_id, title, thumbnail_url
     download_completed = Signal(str, str, str)  # item_id, title, output_path
     download_failed = Signal(str, str, str)  # item_id, title, error
     download_skipped = Signal(str, str)  # item_id, reason
+    history_entry_added = Signal(dict)  # entry as returned by get_history()
     log_message = Signal(str)  # message
     queue_empty = Signal()
     all_workers_idle = Signal()
@@ -92,6 +154,8 @@ class MetadataWorker(QRunnable):
         self.setAutoDelete(True)
         
     def run(self):
+        import yt_dlp
+        
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
@@ -109,11 +173,75 @@ class MetadataWorker(QRunnable):
             self.signals.error.emit(str(e))
 
 
+class _PostProcessSlot:
+    """One item's claim on the manager's post-processing semaphore."""
+    
+    def __init__(self, semaphore: QSemaphore):
+        self._semaphore = semaphore
+        self._held = False
+    
+    def acquire(self):
+        if not self._held:
+            self._semaphore.acquire()
+            self._held = True
+    
+    def release(self):
+        if self._held:
+            self._semaphore.release()
+            self._held = False
+
+
+@lru_cache(maxsize=None)
+def http_session():
+    """Shared requests session, so repeat requests reuse open connections."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class HttpSignals(QObject):
+    """Signals for HTTP requests."""
+    finished = Signal(object, object)  # bytes or decoded JSON (None on 304), headers
+    error = Signal(str)
+
+
+class HttpWorker(QRunnable):
+    """Worker to run a GET request off the GUI thread."""
+    
+    def __init__(self, url: str, session=None, timeout: float = 5, as_json: bool = False,
+                 headers: Optional[Dict[str, str]] = None):
+        super().__init__()
+        self.url = url
+        self.session = session
+        self.timeout = timeout
+        self.as_json = as_json
+        self.headers = headers
+        self.signals = HttpSignals()
+        self.setAutoDelete(True)
+    
+    def run(self):
+        try:
+            resp = (self.session or http_session()).get(self.url, timeout=self.timeout, headers=self.headers)
+            if resp.status_code == 304:
+                self.signals.finished.emit(None, resp.headers)
+                return
+            resp.raise_for_status()
+            self.signals.finished.emit(resp.json() if self.as_json else resp.content, resp.headers)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
 class DownloadWorker(QThread):
     """Worker thread for processing downloads."""
     
     def __init__(self, worker_id: int, task_queue: Queue, signals: DownloadSignals,
                  pause_mutex: QMutex, pause_condition: QWaitCondition, 
+                 postprocess_semaphore: QSemaphore, post_progress: Callable[[str, float, str], None],
                  duplicate_policy: str = "ask"):
         super().__init__()
         self.worker_id = worker_id
@@ -121,10 +249,17 @@ class DownloadWorker(QThread):
         self.signals = signals
         self.pause_mutex = pause_mutex
         self.pause_condition = pause_condition
+        self.postprocess_semaphore = postprocess_semaphore
+        self.post_progress = post_progress
         self.duplicate_policy = duplicate_policy
         self._stop_requested = False
         self._paused = False
         self._current_item: Optional[DownloadItem] = None
+        # Reused while consecutive items need the same options
+        self._ydl: Optional["yt_dlp.YoutubeDL"] = None
+        self._ydl_key: Optional[str] = None
+        self._progress_hook: Optional[Callable] = None
+        self._slot: Optional[_PostProcessSlot] = None
     
     def request_stop(self):
         """Request the worker to stop after current download."""
@@ -148,39 +283,76 @@ class DownloadWorker(QThread):
             if self._stop_requested:
                 break
             
+            # Sleep until work arrives; stop() queues one None per worker
+            item = self.task_queue.get()
+            if item is None:
+                self.task_queue.task_done()
+                break
+            
             try:
-                # Get next item from queue (non-blocking)
-                try:
-                    item = self.task_queue.get(timeout=0.5)
-                except:
-                    continue
-                
                 self._current_item = item
                 self._process_download(item)
-                self._current_item = None
-                self.task_queue.task_done()
-                
             except Exception as e:
                 # self.signals.log_message.emit(f"[Worker {self.worker_id}] Error: {str(e)}")
                 pass
+            finally:
+                self._current_item = None
+                self.task_queue.task_done()
+        
+        self._close_ydl()
+    
+    def _get_ydl(self, ydl_opts: dict) -> "yt_dlp.YoutubeDL":
+        """The worker's YoutubeDL, rebuilt only when the options change."""
+        import yt_dlp
+        
+        key = repr(ydl_opts)
+        if self._ydl is None or key != self._ydl_key:
+            self._close_ydl()
+            # Hooks are fixed at construction; these forward to the current item
+            ydl_opts['progress_hooks'] = [lambda d: self._progress_hook(d)]
+            # yt-dlp runs FFmpeg on this thread after the download; wait for
+            # a free post-processing slot before it starts
+            ydl_opts['postprocessor_hooks'] = [
+                lambda d: self._slot.acquire() if d['status'] == 'started' else None
+            ]
+            self._ydl = yt_dlp.YoutubeDL(ydl_opts)
+            self._ydl_key = key
+        return self._ydl
+    
+    def _close_ydl(self):
+        if self._ydl is not None:
+            try:
+                self._ydl.close()
+            except Exception:
+                pass
+            self._ydl = None
+            self._ydl_key = None
     
     def _process_download(self, item: DownloadItem):
         """Process a single download item."""
         item.status = DownloadStatus.DOWNLOADING
+        slot = _PostProcessSlot(self.postprocess_semaphore)
+        self._slot = slot
+        self._progress_hook = self._make_progress_hook(item, slot)
         
         try:
-            # Build yt-dlp options
-            ydl_opts = self._build_ydl_options(item)
+            # One YoutubeDL for the info lookup and the download, kept for the
+            # next item when its options match (postprocessors/templates are
+            # fixed at construction, so a different mode or folder rebuilds it)
+            ydl = self._get_ydl(self._build_ydl_options(item))
+            # Extract info first to get title if not provided.
+            # process=False stops at the extractor's result: playlist
+            # entries stay a lazy generator, and the result is handed
+            # straight to the download so the page is fetched only once.
+            info = None
+            if not item.title:
+                info = ydl.extract_info(item.url, download=False, process=False)
+                if info:
+                    item.title = info.get('title', 'Unknown')
+                    thumbnails = info.get('thumbnails') or [{}]
+                    item.thumbnail = info.get('thumbnail') or thumbnails[-1].get('url', '')
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # Extract info first to get title if not provided
-                if not item.title:
-                    info = ydl.extract_info(item.url, download=False)
-                    if info:
-                        item.title = info.get('title', 'Unknown')
-                        item.thumbnail = info.get('thumbnail', '')
-                
-                self._download_single(item, ydl_opts)
+            self._download_single(item, ydl, info)
             
             item.status = DownloadStatus.COMPLETED
             
@@ -189,68 +361,83 @@ class DownloadWorker(QThread):
             item.error_message = str(e)
             self.signals.download_failed.emit(item.item_id, item.title or item.url, str(e))
             self.signals.log_message.emit(f"[Worker {self.worker_id}] Failed: {item.url} - {str(e)}")
+        finally:
+            slot.release()
     
-    def _download_single(self, item: DownloadItem, ydl_opts: dict):
-        """Download a single video/audio."""
+    def _download_single(self, item: DownloadItem, ydl: "yt_dlp.YoutubeDL",
+                         info: Optional[dict] = None):
+        """Download a single video/audio, reusing an unprocessed probe result."""
         self.signals.download_started.emit(item.item_id, item.title or item.url, item.thumbnail or "")
         
-        # Create progress hook for this item
-        def progress_hook(d):
-            if d['status'] == 'downloading':
-                total = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
-                downloaded = d.get('downloaded_bytes', 0)
-                if total > 0:
-                    progress = (downloaded / total) * 100
-                    item.progress = progress
-                    speed = d.get('speed', 0) or 0
-                    speed_str = f"{speed / 1024:.1f} KB/s" if speed else "-- KB/s"
-                    eta = d.get('eta', 0) or 0
-                    eta_str = f"ETA: {eta}s" if eta else ""
-                    status_text = f"{progress:.1f}% | {speed_str} {eta_str}"
-                    self.signals.progress_updated.emit(item.item_id, progress, status_text)
-            
-            elif d['status'] == 'finished':
-                item.progress = 100
-                item.output_path = d.get('filename', '')
-                self.signals.progress_updated.emit(item.item_id, 100, "Processing...")
-        
-        # Update options with progress hook
-        opts = ydl_opts.copy()
-        opts['progress_hooks'] = [progress_hook]
-        
         try:
-            with yt_dlp.YoutubeDL(opts) as ydl:
+            if info:
+                # Same path download() takes after extracting, minus the extraction
+                ydl.process_ie_result(info, download=True)
+            else:
                 ydl.download([item.url])
             
             item.status = DownloadStatus.COMPLETED
             self.signals.download_completed.emit(item.item_id, item.title, item.output_path)
             self.signals.log_message.emit(f"[Worker {self.worker_id}] Completed: {item.title}")
             
-            # Add to history
-            self._add_to_history(item)
-            
         except Exception as e:
             raise e
     
+    def _make_progress_hook(self, item: DownloadItem, slot: _PostProcessSlot):
+        """Create the yt-dlp progress hook for an item."""
+        # Everything the per-chunk path touches is bound once, here
+        emit = self.post_progress
+        release = slot.release
+        monotonic = time.monotonic
+        item_id = item.item_id
+        last_emit = 0.0
+        last_text = ""
+        
+        def progress_hook(d):
+            nonlocal last_emit, last_text
+            status = d['status']
+            if status == 'downloading':
+                # Next playlist entry: the previous one's FFmpeg work is done
+                release()
+                
+                # yt-dlp calls this per chunk; don't queue a signal for each
+                now = monotonic()
+                if now - last_emit < PROGRESS_EMIT_INTERVAL:
+                    return
+                last_emit = now
+                
+                # yt-dlp sends None, not a missing key, for unknown values
+                total = d.get('total_bytes') or d.get('total_bytes_estimate')
+                if total:
+                    progress = (d.get('downloaded_bytes') or 0) * 100 / total
+                    item.progress = progress
+                    speed = d.get('speed')
+                    eta = d.get('eta')
+                    status_text = "%.1f%% | %s %s" % (
+                        progress,
+                        "%.1f KB/s" % (speed * 0.0009765625) if speed else "-- KB/s",
+                        "ETA: %ds" % eta if eta else "",
+                    )
+                    # Stalled downloads repeat the same text; nothing to show
+                    if status_text == last_text:
+                        return
+                    last_text = status_text
+                    emit(item_id, progress, status_text)
+            
+            elif status == 'finished':
+                item.progress = 100
+                item.output_path = d.get('filename', '')
+                emit(item_id, 100, "Processing...")
+        
+        return progress_hook
+    
     def _build_ydl_options(self, item: DownloadItem) -> dict:
         """Build yt-dlp options based on download item settings."""
-        output_template = os.path.join(item.output_dir, '%(title)s.%(ext)s')
-        
-        opts = {
-            'outtmpl': output_template,
-            'ignoreerrors': True,
-            'no_warnings': False,
-            'quiet': True,
-            'no_color': True,
-            'socket_timeout': 30,
-            'retries': 10,
-            'prefer_ffmpeg': True,
-        }
+        opts = _BASE_YDL_OPTS.copy()
+        opts['outtmpl'] = os.path.join(item.output_dir, '%(title)s.%(ext)s')
         
         if item.mode == DownloadMode.AUDIO:
-            audio_format = item.output_format.lower()
-            codec_map = {'mp3': 'mp3', 'aac': 'aac', 'wav': 'wav', 'flac': 'flac'}
-            codec = codec_map.get(audio_format, 'mp3')
+            codec = _AUDIO_CODECS.get(item.output_format.lower(), 'mp3')
             
             opts.update({
                 'format': 'bestaudio/best',
@@ -261,16 +448,16 @@ class DownloadWorker(QThread):
             })
         else:
             # Video
-            container = item.output_format.lower() if item.output_format.lower() in ['mp4', 'mkv', 'webm'] else 'mp4'
+            container = item.output_format.lower()
+            if container not in _VIDEO_CONTAINERS:
+                container = 'mp4'
             
             # Simplified format selection for robustness
-            if item.quality == 'best':
-                format_str = f"bestvideo+bestaudio/best"
-            elif item.quality in ['1080p', '720p', '480p', '360p']:
-                h = item.quality[:-1]
+            h = _VIDEO_HEIGHTS.get(item.quality)
+            if h:
                 format_str = f"bestvideo[height<={h}]+bestaudio/best[height<={h}]/best"
             else:
-                format_str = f"bestvideo+bestaudio/best"
+                format_str = "bestvideo+bestaudio/best"
 
             opts.update({
                 'format': format_str,
@@ -280,42 +467,15 @@ class DownloadWorker(QThread):
         
         return opts
     
-    def _add_to_history(self, item: DownloadItem):
-        """Add completed download to history.json."""
-        try:
-            history_path = Path(item.output_dir) / 'history.json'
-            history = []
-            
-            if history_path.exists():
-                with open(history_path, 'r') as f:
-                    history = json.load(f)
-            
-            entry = {
-                'title': item.title,
-                'url': item.url,
-                'mode': item.mode.value,
-                'quality': item.quality,
-                'output_path': item.output_path,
-                'status': 'completed',
-                'timestamp': datetime.now().isoformat(),
-            }
-            
-            history.insert(0, entry)
-            history = history[:50]
-            
-            with open(history_path, 'w') as f:
-                json.dump(history, f, indent=2)
-        except Exception:
-            pass
 
 
 class DownloadManager(QObject):
     """Manages the download queue and worker threads."""
     
-    def __init__(self, output_dir: str = "./downloads", max_workers: int = 3):
+    def __init__(self, output_dir: str = "./downloads", max_workers: Optional[int] = None):
         super().__init__()
         self.output_dir = output_dir
-        self.max_workers = max_workers
+        self.max_workers = max_workers or DEFAULT_WORKERS
         
         self.signals = DownloadSignals()
         self.task_queue: Queue = Queue()
@@ -327,9 +487,37 @@ class DownloadManager(QObject):
         self._paused = False
         self._pause_mutex = QMutex()
         self._pause_condition = QWaitCondition()
+        self._postprocess_semaphore = QSemaphore(POSTPROCESS_SLOTS)
         
         # Ensure output directory exists
         Path(output_dir).mkdir(parents=True, exist_ok=True)
+        
+        # History lives in memory; history.json is written shortly after it
+        # changes. Completions arrive here queued onto the manager's thread.
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=HISTORY_LIMIT)
+        self._history_dirty = False
+        self._history_timer = QTimer(self)
+        self._history_timer.setSingleShot(True)
+        self._history_timer.setInterval(HISTORY_FLUSH_DELAY_MS)
+        self._history_timer.timeout.connect(self._flush_history)
+        self._load_history()
+        self.signals.download_completed.connect(self._record_history)
+        # Front ends don't all call stop(); never lose entries still on the timer
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_history)
+        
+        # Workers post progress here; one timer hands it to the UI in batches
+        self._progress_lock = threading.Lock()
+        self._pending_progress: Dict[str, tuple] = {}
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_BATCH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self.signals.progress_pending.connect(self._progress_timer.start)
+        # Connected before any UI slot: a stale update can't follow the final state
+        self.signals.download_completed.connect(self._drop_progress)
+        self.signals.download_failed.connect(self._drop_progress)
     
     def fetch_metadata(self, url: str, on_success, on_error):
         """Fetch metadata for a URL asynchronously."""
@@ -339,11 +527,15 @@ class DownloadManager(QObject):
         self.threadpool.start(worker)
 
     def set_output_dir(self, path: str):
+        if path == self.output_dir:
+            return
+        self._flush_history()
         self.output_dir = path
         Path(path).mkdir(parents=True, exist_ok=True)
+        self._load_history()
         
     def set_worker_count(self, count: int):
-        self.max_workers = max(1, min(5, count))
+        self.max_workers = max(1, min(MAX_WORKERS, count))
 
     def add_download(self, url: str, mode: str, quality: str, output_format: str, title: str = ""):
         """Add a download task."""
@@ -363,6 +555,27 @@ class DownloadManager(QObject):
         self.start()
         return item.item_id
 
+    def add_urls(self, urls: List[str], mode, quality: str, speed_limit: int,
+                 output_format: str) -> List[str]:
+        """Queue several downloads, then start workers once."""
+        mode_enum = DownloadMode(mode)
+        items = [
+            DownloadItem(
+                url=url,
+                mode=mode_enum,
+                quality=quality,
+                output_dir=self.output_dir,
+                speed_limit=speed_limit,
+                output_format=output_format
+            )
+            for url in urls
+        ]
+        for item in items:
+            self.items[item.item_id] = item
+            self.task_queue.put(item)
+        self.start()
+        return [item.item_id for item in items]
+
     def start(self):
         """Start the download workers."""
         # Clean up dead workers
@@ -374,22 +587,101 @@ class DownloadManager(QObject):
                 task_queue=self.task_queue,
                 signals=self.signals,
                 pause_mutex=self._pause_mutex,
-                pause_condition=self._pause_condition
+                pause_condition=self._pause_condition,
+                postprocess_semaphore=self._postprocess_semaphore,
+                post_progress=self._post_progress
             )
             worker.start()
             self.workers.append(worker)
 
+    def _post_progress(self, item_id: str, progress: float, status_text: str):
+        """Record an item's latest progress (called on worker threads)."""
+        with self._progress_lock:
+            first = not self._pending_progress
+            self._pending_progress[item_id] = (progress, status_text)
+        if first:
+            self.signals.progress_pending.emit()
+
+    def _flush_progress(self):
+        with self._progress_lock:
+            pending, self._pending_progress = self._pending_progress, {}
+        if pending:
+            self.signals.progress_batch.emit(
+                [(item_id, progress, text) for item_id, (progress, text) in pending.items()]
+            )
+
+    def _drop_progress(self, item_id: str, *_):
+        with self._progress_lock:
+            self._pending_progress.pop(item_id, None)
+
     def get_history(self) -> List[Dict[str, Any]]:
-        history_path = Path(self.output_dir) / 'history.json'
-        if not history_path.exists():
-            return []
+        # Entries store the raw time_ns(); the UI expects an ISO 'timestamp'
+        return [
+            {**entry, 'timestamp': _format_timestamp(entry['timestamp_ns'])}
+            if 'timestamp_ns' in entry else entry
+            for entry in self._history
+        ]
+
+    def _history_path(self) -> Path:
+        return Path(self.output_dir) / 'history.json'
+
+    def _load_history(self):
+        """Read history.json for the current output directory."""
+        self._history.clear()
+        self._history_dirty = False
+        try:
+            with open(self._history_path(), 'rb') as f:
+                self._history.extend(_load_history_data(f.read()))
+        except (OSError, ValueError):
+            pass
+
+    def _record_history(self, item_id: str, title: str, output_path: str):
+        """Add a completed download to history and schedule a write."""
+        item = self.items.get(item_id)
+        if item is None:
+            return
+        entry = {
+            'title': item.title,
+            'url': item.url,
+            'mode': item.mode.value,
+            'quality': item.quality,
+            'output_path': item.output_path,
+            'status': 'completed',
+            'timestamp_ns': time.time_ns(),
+        }
+        self._history.appendleft(entry)
+        self.signals.history_entry_added.emit(
+            {**entry, 'timestamp': _format_timestamp(entry['timestamp_ns'])}
+        )
+        self._history_dirty = True
+        if not self._history_timer.isActive():
+            self._history_timer.start()
+
+    def _flush_history(self):
+        """Write history.json atomically if it has unsaved entries."""
+        self._history_timer.stop()
+        if not self._history_dirty:
+            return
+        history_path = self._history_path()
+        tmp_path = history_path.with_name(history_path.name + '.tmp')
         try:
-            with open(history_path, 'r') as f:
-                return json.load(f)
-        except:
-            return []
+            with open(tmp_path, 'wb') as f:
+                f.write(_dump_history(list(self._history)))
+            os.replace(tmp_path, history_path)
+            self._history_dirty = False
+        except OSError:
+            # history.json is untouched; don't leave a half-written temp file
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
     def stop(self):
         for w in self.workers:
             w.request_stop()
+            # Wake workers blocked on an empty queue
+            self.task_queue.put(None)
+        # ...and any waiting on pause
+        self._pause_condition.wakeAll()
         self.threadpool.clear()
+        self._flush_history()
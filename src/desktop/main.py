@@ -16,8 +16,7 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon
 
-from src.desktop.ui.main_window import MainWindow
-from src.core.utils import resource_path
+from src.core.utils import icon_path
 
 
 def main():
@@ -27,9 +26,16 @@ def main():
     app.setOrganizationName("Cybertron")
     
     # Set app icon
-    icon_path = resource_path("assets/icon.png")
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    app_icon = icon_path("icon.png")
+    if app_icon:
+        app.setWindowIcon(QIcon(app_icon))
+    
+    # Imported only once the QApplication exists, so the UI modules (and
+    # what they pull in) load after Qt is up rather than before it
+    from src.desktop.ui.main_window import MainWindow, STYLE_SHEET
+    
+    # One stylesheet for the whole app, parsed once
+    app.setStyleSheet(STYLE_SHEET)
     
     window = MainWindow()
     window.show()
@@ -1,3 +1,3 @@
 # Desktop UI Components
 from .main_window import MainWindow
-from .components import DownloadCard, DuplicateDialog
+from .components import DuplicateDialog
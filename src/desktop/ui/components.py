@@ -1,110 +1,256 @@
-from typing import List
+from dataclasses import dataclass
+from typing import List, Dict
 from PySide6.QtWidgets import (
-    QFrame, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QPushButton, 
-    QDialog, QListWidget, QGraphicsDropShadowEffect
+    QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QDialog, QListWidget, QStyledItemDelegate
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import (
+    Qt, QSize, QRect, QRectF, QTimer, QModelIndex, QAbstractListModel,
+    QObject, QRunnable, Signal, QBuffer, QByteArray, QIODevice
+)
+from PySide6.QtGui import QFont, QColor, QPainter, QPen, QFontMetrics, QImage, QImageReader
 
 # Use system font or simple sans-serif
 import sys
 # Use system font or simple sans-serif
 FONT_FAMILY = "Segoe UI" if sys.platform == "win32" else "Helvetica Neue"
 
-class DownloadCard(QFrame):
-    """Minimalist progress card."""
+# Stylesheets are shared string constants so Qt parses each one only once
+DIALOG_QSS = """
+    QDialog { background-color: #1E1E1E; color: #EEE; }
+    QLabel { color: #EEE; }
+    QListWidget { background-color: #252526; border: 1px solid #3E3E42; color: #AAA; }
+    QPushButton { 
+        background-color: #333; color: white; border: 1px solid #444; 
+        padding: 6px 12px; border-radius: 4px;
+    }
+    QPushButton:hover { background-color: #444; }
+"""
+
+# Queue row appearance
+QUEUE_ROW_HEIGHT = 65
+QUEUE_CARD_BG = QColor("#252526")
+QUEUE_CARD_BORDER = QColor("#3E3E42")
+QUEUE_TITLE_COLOR = QColor("#E0E0E0")
+QUEUE_TRACK_COLOR = QColor("#333333")
+# state -> (status text colour, progress chunk colour)
+QUEUE_STATE_COLORS = {
+    "progress": (QColor("#888888"), QColor("#007ACC")),
+    "completed": (QColor("#4EC9B0"), QColor("#4EC9B0")),
+    "failed": (QColor("#F44747"), QColor("#F44747")),
+}
+# Milliseconds between batched repaints of the queue view
+QUEUE_REFRESH_INTERVAL = 100
+
+
+@dataclass
+class QueueEntry:
+    """Display state of one row in the download queue."""
+    item_id: str
+    title: str
+    progress: float = 0.0
+    status: str = "Initializing..."
+    state: str = "progress"  # "progress", "completed" or "failed"
+
+
+class DownloadListModel(QAbstractListModel):
+    """Download queue rows; changes are announced in one batch per tick."""
+    
+    EntryRole = Qt.UserRole + 1
     
-    def __init__(self, item_id: str, title: str, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.item_id = item_id
-        
-        # Styles
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #252526;
-                border-radius: 6px;
-                border: 1px solid #3E3E42;
-            }
-            QLabel {
-                border: none;
-                color: #E0E0E0;
-            }
-        """)
-        self.setFixedHeight(65)
-        
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(15, 10, 15, 10)
-        layout.setSpacing(5)
+        self._entries: List[QueueEntry] = []
+        self._by_id: Dict[str, QueueEntry] = {}
+        self._dirty = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(QUEUE_REFRESH_INTERVAL)
+        self._refresh_timer.timeout.connect(self._emit_changes)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == self.EntryRole:
+            return entry
+        if role == Qt.DisplayRole:
+            return entry.title
+        return None
+    
+    def add_download(self, item_id: str, title: str):
+        # Newest on top
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        entry = QueueEntry(item_id, title)
+        self._entries.insert(0, entry)
+        self._by_id[item_id] = entry
+        self.endInsertRows()
+    
+    def update_progress(self, item_id: str, progress: float, status: str):
+        entry = self._by_id.get(item_id)
+        if entry is None:
+            return
+        # Nothing visible would change: same text, bar moves under 1%
+        if (entry.state == "progress" and status == entry.status
+                and abs(progress - entry.progress) < 1):
+            return
+        entry.progress = progress
+        entry.status = status
+        if progress < 100:
+            entry.state = "progress"
+        self._mark_dirty()
+    
+    def set_completed(self, item_id: str):
+        entry = self._by_id.get(item_id)
+        if entry is None:
+            return
+        entry.progress = 100
+        entry.status = "Completed"
+        entry.state = "completed"
+        self._mark_dirty()
+    
+    def set_failed(self, item_id: str, error: str):
+        entry = self._by_id.get(item_id)
+        if entry is None:
+            return
+        entry.progress = 0
+        entry.status = "Failed"
+        entry.state = "failed"
+        self._mark_dirty()
+    
+    def remove_completed(self):
+        """Drop finished and failed rows; active downloads stay listed."""
+        active = [e for e in self._entries if e.state == "progress"]
+        if len(active) == len(self._entries):
+            return
+        self.beginResetModel()
+        self._entries = active
+        self._by_id = {e.item_id: e for e in active}
+        self.endResetModel()
+    
+    def _mark_dirty(self):
+        self._dirty = True
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+    
+    def _emit_changes(self):
+        if self._dirty and self._entries:
+            self.dataChanged.emit(
+                self.index(0), self.index(len(self._entries) - 1), [self.EntryRole]
+            )
+        self._dirty = False
+
+
+class HistoryModel(QAbstractListModel):
+    """Download history rows, replaced all at once on refresh."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict] = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            row = index.row()
+            return f"{row + 1}. {self._rows[row].get('title', 'Unknown')}"
+        return None
+    
+    def set_rows(self, rows: List[Dict]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+
+class DownloadDelegate(QStyledItemDelegate):
+    """Paints a queue row as a card: title, status and a thin progress bar."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._title_font = QFont(FONT_FAMILY)
+        self._title_font.setPixelSize(13)
+        self._title_font.setWeight(QFont.DemiBold)
+        self._status_font = QFont(FONT_FAMILY)
+        self._status_font.setPixelSize(11)
+        self._title_metrics = QFontMetrics(self._title_font)
+        self._status_metrics = QFontMetrics(self._status_font)
+    
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), QUEUE_ROW_HEIGHT)
+    
+    def paint(self, painter, option, index):
+        entry = index.data(DownloadListModel.EntryRole)
+        if entry is None:
+            return
+        status_color, bar_color = QUEUE_STATE_COLORS[entry.state]
+        rect = option.rect
         
-        # Row 1: Title + Status
-        top_row = QHBoxLayout()
-        # Title
-        self.title_label = QLabel(title)
-        self.title_label.setStyleSheet("font-weight: 600; font-size: 13px;")
-        top_row.addWidget(self.title_label, 1)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
         
-        # Status
-        self.status_label = QLabel("Initializing...")
-        self.status_label.setStyleSheet("color: #888; font-size: 11px;")
-        self.status_label.setAlignment(Qt.AlignRight)
-        top_row.addWidget(self.status_label)
+        # Card
+        painter.setPen(QPen(QUEUE_CARD_BORDER, 1))
+        painter.setBrush(QUEUE_CARD_BG)
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 6, 6)
+        inner = rect.adjusted(15, 10, -15, -10)
         
-        layout.addLayout(top_row)
+        # Status on the right, title elided into what's left
+        status_width = self._status_metrics.horizontalAdvance(entry.status)
+        painter.setFont(self._status_font)
+        painter.setPen(status_color)
+        painter.drawText(
+            QRect(inner.right() - status_width, inner.top(), status_width, 20),
+            Qt.AlignRight | Qt.AlignVCenter, entry.status
+        )
+        title_rect = QRect(inner.left(), inner.top(), inner.width() - status_width - 10, 20)
+        painter.setFont(self._title_font)
+        painter.setPen(QUEUE_TITLE_COLOR)
+        painter.drawText(
+            title_rect, Qt.AlignLeft | Qt.AlignVCenter,
+            self._title_metrics.elidedText(entry.title, Qt.ElideRight, title_rect.width())
+        )
         
-        # Row 2: Progress Bar
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setFixedHeight(4)
-        self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                background-color: #333333;
-                border-radius: 2px;
-                border: none;
-            }
-            QProgressBar::chunk {
-                background-color: #007ACC;
-                border-radius: 2px;
-            }
-        """)
-        self.progress_bar.setRange(0, 100)
-        self.progress_bar.setValue(0)
-        layout.addWidget(self.progress_bar)
-    
-    def update_progress(self, progress: float, status: str):
-        self.progress_bar.setValue(int(progress))
-        self.status_label.setText(status)
+        # Progress bar
+        bar = QRectF(inner.left(), inner.bottom() - 3, inner.width(), 4)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QUEUE_TRACK_COLOR)
+        painter.drawRoundedRect(bar, 2, 2)
+        if entry.progress > 0:
+            bar.setWidth(bar.width() * min(entry.progress, 100) / 100)
+            painter.setBrush(bar_color)
+            painter.drawRoundedRect(bar, 2, 2)
         
-        # Reset style if coming back from error/done
-        if progress < 100:
-             self.progress_bar.setStyleSheet("""
-                QProgressBar {
-                    background-color: #333333;
-                    border-radius: 2px;
-                    border: none;
-                }
-                QProgressBar::chunk {
-                    background-color: #007ACC;
-                    border-radius: 2px;
-                }
-            """)
-    
-    def set_completed(self):
-        self.progress_bar.setValue(100)
-        self.status_label.setText("Completed")
-        self.status_label.setStyleSheet("color: #4EC9B0; font-size: 11px;")
-        self.progress_bar.setStyleSheet("""
-            QProgressBar { background-color: #333; border-radius: 2px; }
-            QProgressBar::chunk { background-color: #4EC9B0; border-radius: 2px; }
-        """)
-    
-    def set_failed(self, error: str):
-        self.progress_bar.setValue(0)
-        self.status_label.setText("Failed")
-        self.status_label.setStyleSheet("color: #F44747; font-size: 11px;")
-        self.progress_bar.setStyleSheet("""
-            QProgressBar { background-color: #333; border-radius: 2px; }
-            QProgressBar::chunk { background-color: #F44747; border-radius: 2px; }
-        """)
+        painter.restore()
+
+
+class ThumbnailSignals(QObject):
+    """Signals for thumbnail decoding."""
+    finished = Signal(QImage)
+
+
+class ThumbnailDecoder(QRunnable):
+    """Decode image bytes straight to the size they're shown at."""
+    
+    def __init__(self, data: QByteArray, size: QSize):
+        super().__init__()
+        self.data = data
+        self.size = size
+        self.signals = ThumbnailSignals()
+        self.setAutoDelete(True)
+    
+    def run(self):
+        buffer = QBuffer(self.data)
+        buffer.open(QIODevice.ReadOnly)
+        reader = QImageReader(buffer)
+        # JPEG decoders downscale while decoding instead of after
+        reader.setScaledSize(self.size)
+        image = reader.read()
+        if not image.isNull():
+            self.signals.finished.emit(image)
 
 
 class DuplicateDialog(QDialog):
@@ -119,16 +265,7 @@ class DuplicateDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("File Conflict")
         self.setFixedWidth(400)
-        self.setStyleSheet("""
-            QDialog { background-color: #1E1E1E; color: #EEE; }
-            QLabel { color: #EEE; }
-            QListWidget { background-color: #252526; border: 1px solid #3E3E42; color: #AAA; }
-            QPushButton { 
-                background-color: #333; color: white; border: 1px solid #444; 
-                padding: 6px 12px; border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #444; }
-        """)
+        self.setStyleSheet(DIALOG_QSS)
         
         self.result_action = self.SKIP
         layout = QVBoxLayout(self)
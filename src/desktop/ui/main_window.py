@@ -1,7 +1,8 @@
 import sys
 import os
-import requests
+import time
 import webbrowser
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import List
@@ -9,16 +10,19 @@ from typing import List
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QSpinBox,
-    QStackedWidget, QFrame, QGraphicsDropShadowEffect,
-    QScrollArea, QApplication, QListWidget, QListWidgetItem,
-    QMessageBox, QCheckBox, QAbstractItemView, QFileDialog, QTextEdit
+    QStackedWidget, QFrame,
+    QScrollArea, QApplication, QListWidget,
+    QMessageBox, QCheckBox, QAbstractItemView, QFileDialog, QTextEdit,
+    QListView
 )
-from PySide6.QtCore import Qt, Slot, QSize, QTimer
-from PySide6.QtGui import QIcon, QImage, QPixmap, QColor, QFont
+from PySide6.QtCore import (
+    Qt, Slot, QSize, QTimer, QThreadPool, QSettings, QUrl, QStandardPaths, QSignalBlocker
+)
+from PySide6.QtGui import QIcon, QImage, QPixmap, QPixmapCache, QColor, QFont
 
-from src.core.worker import DownloadManager, DownloadMode
+from src.core.worker import DownloadManager, DownloadMode, HttpWorker, MAX_WORKERS
 from src.core.utils import extract_youtube_urls, resource_path
-from src.desktop.ui.components import DownloadCard
+from src.desktop.ui.components import DownloadListModel, DownloadDelegate, HistoryModel, ThumbnailDecoder
 
 # --- THEME CONSTANTS ---
 COLOR_BG_MAIN = "#F5F5F7"      # Light gray background
@@ -31,8 +35,21 @@ COLOR_TEXT_SUB = "#888888"
 COLOR_BORDER = "#E0E0E0"
 
 APP_VERSION = "v2.1.0"
+# Download choices offered for a single video: (label, mode, quality, format)
+FORMAT_OPTIONS = (
+    ("Video MP4 (1080p)", "video", "1080p", "mp4"),
+    ("Video MP4 (720p)", "video", "720p", "mp4"),
+    ("Video MP4 (480p)", "video", "480p", "mp4"),
+    ("Audio MP3 (Best)", "audio", "best", "mp3"),
+)
+# Seconds a release lookup is reused before asking GitHub again
+UPDATE_CHECK_COOLDOWN = 3600
+# Shortest text that can hold a link ("http://youtu.be/x")
+MIN_URL_LENGTH = 17
 GITHUB_REPO = "ankit-cybertron/YouTube-Downloader-Pro"
 
+# Applied once to the QApplication; widgets are styled by objectName
+# here instead of with their own setStyleSheet() calls
 STYLE_SHEET = f"""
     QMainWindow {{
         background-color: {COLOR_BG_MAIN};
@@ -49,27 +66,27 @@ STYLE_SHEET = f"""
         border-right: 1px solid {COLOR_BORDER};
     }}
     
-    /* Sidebar List */
-    QListWidget {{
+    /* Sidebar List (and the history list, which shares its look) */
+    QListWidget, QListView#historyList {{
         background-color: transparent;
         border: none;
         outline: none;
         margin-top: 20px;
     }}
-    QListWidget::item {{
+    QListWidget::item, QListView#historyList::item {{
         height: 50px;
         padding-left: 20px;
         color: {COLOR_TEXT_SUB};
         border-left: 3px solid transparent;
         margin-bottom: 5px;
     }}
-    QListWidget::item:selected {{
+    QListWidget::item:selected, QListView#historyList::item:selected {{
         color: {COLOR_ACCENT};
         background-color: #FEF2F4;
         border-left: 3px solid {COLOR_ACCENT};
         font-weight: 600;
     }}
-    QListWidget::item:hover:!selected {{
+    QListWidget::item:hover:!selected, QListView#historyList::item:hover:!selected {{
         background-color: #F8F8F8;
         color: {COLOR_TEXT_MAIN};
     }}
@@ -112,11 +129,15 @@ STYLE_SHEET = f"""
     }}
     
     /* Cards */
-    QFrame#card {{
+    QFrame#card, QFrame#searchCard {{
         background-color: {COLOR_BG_CARD};
         border-radius: 12px;
         border: 1px solid {COLOR_BORDER};
     }}
+    /* Stands in for a blurred drop shadow, which re-renders offscreen on every paint */
+    QFrame#searchCard {{
+        border-bottom: 3px solid #E4E4E8;
+    }}
     
     /* Headers */
     QLabel#pageTitle {{
@@ -136,19 +157,110 @@ STYLE_SHEET = f"""
         border: none;
         background-color: transparent;
     }}
+    QListView#queueView {{
+        background: transparent;
+    }}
+    
+    /* Sidebar labels */
+    QLabel#appTitle {{
+        font-size: 22px;
+        font-weight: 900;
+        color: {COLOR_ACCENT};
+        padding: 30px 0;
+    }}
+    QLabel#versionLabel {{
+        color: {COLOR_TEXT_SUB};
+        font-size: 11px;
+    }}
+    
+    /* Download tab */
+    QLabel#inputHint {{
+        color: {COLOR_TEXT_SUB};
+        font-weight: 600;
+    }}
+    QLabel#countBadge {{
+        color: {COLOR_ACCENT};
+        font-weight: 700;
+        background-color: #FEF2F4;
+        padding: 2px 8px;
+        border-radius: 4px;
+    }}
+    QTextEdit#urlInput {{
+        border: 1px solid {COLOR_BORDER};
+        border-radius: 8px;
+        padding: 8px;
+        background-color: {COLOR_BG_CARD};
+        font-size: 14px;
+    }}
+    QTextEdit#urlInput:focus {{
+        border: 1px solid {COLOR_ACCENT};
+    }}
+    QLabel#loadingLabel {{
+        font-size: 18px;
+        color: {COLOR_TEXT_MAIN};
+        font-weight: 600;
+    }}
+    QPushButton#backBtn {{
+        border: none;
+        color: #666;
+        text-align: left;
+    }}
+    QLabel#thumbnail {{
+        background-color: #EEE;
+        border-radius: 8px;
+    }}
+    QLabel#videoTitle {{
+        font-size: 18px;
+        font-weight: 700;
+        margin-top: 10px;
+    }}
+    QLabel#videoMeta {{
+        color: {COLOR_ACCENT};
+        font-weight: 600;
+    }}
+    QFrame#vDivider {{
+        color: #EEE;
+    }}
+    QLabel#optionsTitle {{
+        font-size: 16px;
+        font-weight: 700;
+    }}
+    
+    /* Settings tab */
+    QLabel#versionInfo {{
+        color: #666;
+    }}
 """
 
+@lru_cache(maxsize=None)
+def _placeholder_pixmap() -> QPixmap:
+    """Blank thumbnail shown until the real one arrives (needs a QApplication)."""
+    pix = QPixmap(400, 225)
+    pix.fill(QColor("#EEE"))
+    return pix
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("YouTube Downloader Pro")
         self.resize(1100, 750)
-        self.setStyleSheet(STYLE_SHEET)
         
         # Backend
         self.download_path = str(Path.home() / "Downloads" / "YT-Downloader")
         self.manager = DownloadManager(output_dir=self.download_path)
-        self.download_widgets = {}
+        self.queue_model = DownloadListModel(self)
+        # Thumbnails go through Qt's network stack with an on-disk cache;
+        # created on the first thumbnail so QtNetwork loads only when needed
+        self._thumb_net = None
+        self._thumb_url = None
+        # (text, links) from the last scan of the input box
+        self._last_scan = ("", [])
+        
+        # Count links once typing or pasting settles, not per keystroke
+        self._count_timer = QTimer(self)
+        self._count_timer.setSingleShot(True)
+        self._count_timer.setInterval(150)
+        self._count_timer.timeout.connect(self._check_input_count)
         
         # UI Setup
         self._init_ui()
@@ -172,9 +284,8 @@ class MainWindow(QMainWindow):
         sb_layout.setContentsMargins(0, 0, 0, 20)
         
         # App Logo/Title
-        title_box = QLabel("YT PRO")
+        title_box = QLabel("YT PRO", objectName="appTitle")
         title_box.setAlignment(Qt.AlignCenter)
-        title_box.setStyleSheet(f"font-size: 22px; font-weight: 900; color: {COLOR_ACCENT}; padding: 30px 0;")
         sb_layout.addWidget(title_box)
         
         # Nav List
@@ -188,19 +299,27 @@ class MainWindow(QMainWindow):
         sb_layout.addWidget(self.nav)
         
         # Version
-        ver = QLabel("v2.1.0")
+        ver = QLabel("v2.1.0", objectName="versionLabel")
         ver.setAlignment(Qt.AlignCenter)
-        ver.setStyleSheet(f"color: {COLOR_TEXT_SUB}; font-size: 11px;")
         sb_layout.addWidget(ver)
         
         main_layout.addWidget(sidebar)
         
         # --- CONTENT ---
+        # Only the home tab is built up front; the others fill their
+        # placeholder the first time they're opened
         self.stack = QStackedWidget()
         self.stack.addWidget(self._create_download_tab())  # Index 0
-        self.stack.addWidget(self._create_queue_tab())     # Index 1
-        self.stack.addWidget(self._create_history_tab())   # Index 2
-        self.stack.addWidget(self._create_settings_tab())  # Index 3
+        self._tab_builders = {
+            1: self._create_queue_tab,
+            2: self._create_history_tab,
+            3: self._create_settings_tab,
+        }
+        self._tabs_built = {0: True}
+        for _ in self._tab_builders:
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            self.stack.addWidget(placeholder)
         
         main_layout.addWidget(self.stack)
 
@@ -222,23 +341,16 @@ class MainWindow(QMainWindow):
         
         # Search Card
         card = QFrame()
-        card.setObjectName("card")
+        card.setObjectName("searchCard")
         card.setFixedSize(700, 180) # Increased height slightly
         
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0,0,0,15))
-        shadow.setOffset(0, 5)
-        card.setGraphicsEffect(shadow)
-        
         cl = QVBoxLayout(card)
         cl.setContentsMargins(30, 25, 30, 25)
         
         # Header text
         header_row = QHBoxLayout()
-        header_row.addWidget(QLabel("Paste Video Links or Text", styleSheet=f"color:{COLOR_TEXT_SUB}; font-weight:600;"))
-        self.lbl_count = QLabel("")
-        self.lbl_count.setStyleSheet(f"color: {COLOR_ACCENT}; font-weight: 700; background-color: #FEF2F4; padding: 2px 8px; border-radius: 4px;")
+        header_row.addWidget(QLabel("Paste Video Links or Text", objectName="inputHint"))
+        self.lbl_count = QLabel("", objectName="countBadge")
         self.lbl_count.hide()
         header_row.addWidget(self.lbl_count)
         header_row.addStretch()
@@ -249,21 +361,10 @@ class MainWindow(QMainWindow):
         
         # Multi-line input for "Smart Detection"
         self.url_input = QTextEdit()
+        self.url_input.setObjectName("urlInput")
         self.url_input.setPlaceholderText("Paste text containing YouTube links here...")
         self.url_input.setFixedHeight(60) # height for ~2 lines
-        self.url_input.textChanged.connect(self._check_input_count)
-        self.url_input.setStyleSheet(f"""
-            QTextEdit {{
-                border: 1px solid {COLOR_BORDER};
-                border-radius: 8px;
-                padding: 8px;
-                background-color: {COLOR_BG_CARD};
-                font-size: 14px;
-            }}
-            QTextEdit:focus {{
-                border: 1px solid {COLOR_ACCENT};
-            }}
-        """)
+        self.url_input.textChanged.connect(self._on_input_changed)
         row.addWidget(self.url_input)
         
         btn_go = QPushButton("Analyze")
@@ -288,8 +389,7 @@ class MainWindow(QMainWindow):
         loading_view = QWidget()
         ll = QVBoxLayout(loading_view)
         ll.setAlignment(Qt.AlignCenter)
-        self.lbl_loading = QLabel("Fetching Metadata...")
-        self.lbl_loading.setStyleSheet(f"font-size: 18px; color: {COLOR_TEXT_MAIN}; font-weight: 600;")
+        self.lbl_loading = QLabel("Fetching Metadata...", objectName="loadingLabel")
         ll.addWidget(self.lbl_loading)
         self.dl_stack.addWidget(loading_view)
         
@@ -302,7 +402,7 @@ class MainWindow(QMainWindow):
         # Back nav
         nav_row = QHBoxLayout()
         btn_back = QPushButton("← Back to Search")
-        btn_back.setStyleSheet("border:none; color: #666; text-align:left;")
+        btn_back.setObjectName("backBtn")
         btn_back.setCursor(Qt.PointingHandCursor)
         btn_back.clicked.connect(lambda: self.dl_stack.setCurrentIndex(0))
         nav_row.addWidget(btn_back)
@@ -318,19 +418,16 @@ class MainWindow(QMainWindow):
         
         # Left Info
         left = QVBoxLayout()
-        self.img_thumb = QLabel()
+        self.img_thumb = QLabel(objectName="thumbnail")
         self.img_thumb.setFixedSize(400, 225)
-        self.img_thumb.setStyleSheet("background-color: #EEE; border-radius: 8px;")
-        self.img_thumb.setScaledContents(True)
+        self.img_thumb.setPixmap(_placeholder_pixmap())
         left.addWidget(self.img_thumb)
         
-        self.lbl_title = QLabel("Title")
+        self.lbl_title = QLabel("Title", objectName="videoTitle")
         self.lbl_title.setWordWrap(True)
-        self.lbl_title.setStyleSheet("font-size: 18px; font-weight: 700; margin-top: 10px;")
         left.addWidget(self.lbl_title)
         
-        self.lbl_meta = QLabel("Channel • 10:00")
-        self.lbl_meta.setStyleSheet(f"color: {COLOR_ACCENT}; font-weight: 600;")
+        self.lbl_meta = QLabel("Channel • 10:00", objectName="videoMeta")
         left.addWidget(self.lbl_meta)
         left.addStretch()
         
@@ -339,16 +436,18 @@ class MainWindow(QMainWindow):
         # Divider
         div = QFrame()
         div.setFrameShape(QFrame.VLine)
-        div.setStyleSheet("color: #EEE;")
+        div.setObjectName("vDivider")
         dl_layout.addWidget(div)
         
         # Right Options
         right = QVBoxLayout()
         right.setContentsMargins(20, 0, 0, 0)
-        right.addWidget(QLabel("Download Options", styleSheet="font-size:16px; font-weight:700;"))
+        right.addWidget(QLabel("Download Options", objectName="optionsTitle"))
         right.addSpacing(20)
         
         self.combo_fmt = QComboBox()
+        for label, mode, quality, fmt in FORMAT_OPTIONS:
+            self.combo_fmt.addItem(label, (mode, quality, fmt))
         right.addWidget(QLabel("Format / Quality"))
         right.addWidget(self.combo_fmt)
         
@@ -386,18 +485,16 @@ class MainWindow(QMainWindow):
         head.addWidget(btn_clear)
         layout.addLayout(head)
         
-        # Scroll List
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        
-        self.queue_container = QWidget()
-        self.queue_layout = QVBoxLayout(self.queue_container)
-        self.queue_layout.setAlignment(Qt.AlignTop)
-        self.queue_layout.setSpacing(10)
-        
-        scroll.setWidget(self.queue_container)
-        layout.addWidget(scroll)
+        # Queue list: rows are painted by the delegate, no widget per download
+        self.queue_view = QListView(objectName="queueView")
+        self.queue_view.setModel(self.queue_model)
+        self.queue_view.setItemDelegate(DownloadDelegate(self.queue_view))
+        self.queue_view.setUniformItemSizes(True)
+        self.queue_view.setSpacing(5)
+        self.queue_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.queue_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.queue_view.setFrameShape(QFrame.NoFrame)
+        layout.addWidget(self.queue_view)
         
         return tab
 
@@ -414,12 +511,13 @@ class MainWindow(QMainWindow):
         head.addWidget(btn_ref)
         layout.addLayout(head)
         
-        self.hist_list = QListWidget()
+        self.hist_model = HistoryModel(self)
+        self.hist_list = QListView(objectName="historyList")
+        self.hist_list.setModel(self.hist_model)
+        self.hist_list.setUniformItemSizes(True)
         self.hist_list.setFrameShape(QFrame.NoFrame)
-        self.hist_list.setStyleSheet("background: transparent;")
         layout.addWidget(self.hist_list)
         
-        self._load_history()
         return tab
 
     def _create_settings_tab(self):
@@ -453,8 +551,8 @@ class MainWindow(QMainWindow):
         gl.addWidget(QLabel("Concurrent Downloads", objectName="sectionTitle"))
         row2 = QHBoxLayout()
         spin = QSpinBox()
-        spin.setRange(1, 10)
-        spin.setValue(3)
+        spin.setRange(1, MAX_WORKERS)
+        spin.setValue(self.manager.max_workers)
         spin.setFixedWidth(100)
         spin.valueChanged.connect(lambda v: self.manager.set_worker_count(v))
         row2.addWidget(spin)
@@ -464,7 +562,7 @@ class MainWindow(QMainWindow):
         # Updates
         gl.addWidget(QLabel("Updates", objectName="sectionTitle"))
         u_row = QHBoxLayout()
-        u_row.addWidget(QLabel(f"Current Version: {APP_VERSION}", styleSheet="color: #666;"))
+        u_row.addWidget(QLabel(f"Current Version: {APP_VERSION}", objectName="versionInfo"))
         u_row.addStretch()
         btn_upd = QPushButton("Check for Updates")
         btn_upd.setCursor(Qt.PointingHandCursor)
@@ -478,21 +576,40 @@ class MainWindow(QMainWindow):
     # --- LOGIC ---
     
     def _connect_signals(self):
-        self.manager.signals.progress_updated.connect(self._on_progress)
-        self.manager.signals.download_completed.connect(self._on_completed)
-        self.manager.signals.download_failed.connect(self._on_failed)
-        self.manager.signals.download_started.connect(self._on_started)
+        # Emitted from worker threads; queue them explicitly onto the GUI thread
+        signals = self.manager.signals
+        signals.download_completed.connect(self._on_completed, Qt.QueuedConnection)
+        signals.download_failed.connect(self._on_failed, Qt.QueuedConnection)
+        signals.download_started.connect(self._on_started, Qt.QueuedConnection)
+        # Batched by the manager on the GUI thread
+        signals.progress_batch.connect(self._on_progress_batch)
 
     def switch_tab(self, idx):
+        self._ensure_tab_built(idx)
         self.stack.setCurrentIndex(idx)
         if idx == 2:
             self._load_history()
 
+    def _ensure_tab_built(self, idx):
+        """Build a tab's real content on first use."""
+        if self._tabs_built.get(idx) or idx not in self._tab_builders:
+            return
+        self._tabs_built[idx] = True
+        self.stack.widget(idx).layout().addWidget(self._tab_builders[idx]())
+
+    @Slot()
+    def _on_input_changed(self):
+        # characterCount() includes the trailing paragraph separator; text
+        # shorter than a link is handled without copying it out of Qt
+        if self.url_input.document().characterCount() <= MIN_URL_LENGTH:
+            self._count_timer.stop()
+            self.lbl_count.hide()
+            return
+        self._count_timer.start()
+
     @Slot()
     def _check_input_count(self):
-        text = self.url_input.toPlainText()
-        urls = extract_youtube_urls(text)
-        count = len(urls)
+        count = len(self._scan_input())
         
         if count > 0:
             self.lbl_count.setText(f"{count} Link{'s' if count > 1 else ''} Found")
@@ -500,13 +617,21 @@ class MainWindow(QMainWindow):
         else:
             self.lbl_count.hide()
 
+    def _scan_input(self):
+        """Links in the input box (already de-duplicated), cached per text."""
+        text = self.url_input.toPlainText()
+        if text != self._last_scan[0]:
+            self._last_scan = (text, extract_youtube_urls(text))
+        return self._last_scan[1]
+
     @Slot()
     def _process_input(self):
-        text = self.url_input.toPlainText().strip()
-        if not text:
+        if not self.url_input.toPlainText().strip():
             return
-            
-        urls = extract_youtube_urls(text)
+        
+        # Usually already scanned for the link counter
+        urls = self._scan_input()
+        text = self._last_scan[0]
         
         if len(urls) == 0:
             QMessageBox.warning(self, "Invalid URL", "No YouTube links found in the text.")
@@ -540,19 +665,19 @@ class MainWindow(QMainWindow):
         
         # Load Thumb
         t_url = info.get('thumbnail')
-        if t_url:
-            self._load_thumb(t_url)
+        self._thumb_url = t_url
+        cached = QPixmapCache.find(self._thumb_key(t_url)) if t_url else None
+        if cached is not None and not cached.isNull():
+            # Seen this session: no disk cache read, no decode
+            self.img_thumb.setPixmap(cached)
+        else:
+            # Don't leave the previous video's thumbnail up while this one loads
+            self.img_thumb.setPixmap(_placeholder_pixmap())
+            if t_url:
+                self._load_thumb(t_url)
             
-        # Formats
-        self.combo_fmt.clear()
-        opts = [
-            ("Video MP4 (1080p)", "video", "1080p", "mp4"),
-            ("Video MP4 (720p)", "video", "720p", "mp4"),
-            ("Video MP4 (480p)", "video", "480p", "mp4"),
-            ("Audio MP3 (Best)", "audio", "best", "mp3"),
-        ]
-        for l, m, q, f in opts:
-            self.combo_fmt.addItem(l, (m, q, f))
+        # Formats (the list itself is fixed)
+        self.combo_fmt.setCurrentIndex(0)
             
         self.dl_stack.setCurrentIndex(2) # Result page
 
@@ -573,7 +698,7 @@ class MainWindow(QMainWindow):
         # Go to queue
         self.nav.setCurrentRow(1)
         self.dl_stack.setCurrentIndex(0) # Reset home
-        self.url_input.clear()
+        self._clear_input()
 
     def _start_batch(self, urls):
         # Add all with defaults (Video 1080p for now, or could ask)
@@ -582,35 +707,79 @@ class MainWindow(QMainWindow):
             self.manager.add_download(url, "video", "best", "mp4")
             
         self.nav.setCurrentRow(1) # Switch to queue
-        self.url_input.clear()
+        self._clear_input()
+
+    def _thumb_network(self):
+        from PySide6.QtNetwork import QNetworkAccessManager, QNetworkDiskCache
+        
+        if self._thumb_net is None:
+            cache = QNetworkDiskCache(self)
+            cache.setCacheDirectory(os.path.join(
+                QStandardPaths.writableLocation(QStandardPaths.CacheLocation), "thumbnails"
+            ))
+            self._thumb_net = QNetworkAccessManager(self)
+            self._thumb_net.setCache(cache)
+        return self._thumb_net
+
+    def _clear_input(self):
+        # No textChanged round-trip (and link scan) for our own clear
+        with QSignalBlocker(self.url_input):
+            self.url_input.clear()
+        self._count_timer.stop()
+        self.lbl_count.hide()
 
     def _load_thumb(self, url):
-        try:
-            data = requests.get(url, timeout=3).content
-            pix = QPixmap()
-            pix.loadFromData(data)
-            self.img_thumb.setPixmap(pix)
-        except:
-            pass
+        from PySide6.QtNetwork import QNetworkRequest
+        
+        self._thumb_url = url
+        request = QNetworkRequest(QUrl(url))
+        request.setAttribute(QNetworkRequest.CacheLoadControlAttribute, QNetworkRequest.PreferCache)
+        request.setTransferTimeout(3000)
+        reply = self._thumb_network().get(request)
+        reply.finished.connect(lambda: self._on_thumb_loaded(url, reply))
+
+    def _on_thumb_loaded(self, url, reply):
+        from PySide6.QtNetwork import QNetworkReply
+        
+        reply.deleteLater()
+        # Ignore a slow thumbnail for a video that's no longer shown
+        if url != self._thumb_url or reply.error() != QNetworkReply.NoError:
+            return
+        # Decode off the GUI thread at the label's size in device pixels
+        dpr = self.img_thumb.devicePixelRatioF()
+        decoder = ThumbnailDecoder(reply.readAll(), self.img_thumb.size() * dpr)
+        decoder.signals.finished.connect(lambda image: self._on_thumb_decoded(url, image, dpr))
+        QThreadPool.globalInstance().start(decoder)
+
+    def _on_thumb_decoded(self, url, image, dpr):
+        if url != self._thumb_url:
+            return
+        pix = QPixmap.fromImage(image)
+        pix.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(self._thumb_key(url), pix)
+        self.img_thumb.setPixmap(pix)
+
+    def _thumb_key(self, url):
+        # Decoded pixmaps are sized for the current screen's pixel ratio
+        return f"{url}@{self.img_thumb.devicePixelRatioF()}"
 
     # Worker Signals
+    @Slot(str, str, str)
     def _on_started(self, item_id, title, thumb):
-        # Create card widget
-        card = DownloadCard(item_id, title)
-        self.queue_layout.insertWidget(0, card)
-        self.download_widgets[item_id] = card
+        self.queue_model.add_download(item_id, title)
 
-    def _on_progress(self, item_id, val, text):
-        if item_id in self.download_widgets:
-            self.download_widgets[item_id].update_progress(val, text)
+    @Slot(list)
+    def _on_progress_batch(self, updates):
+        for item_id, val, text in updates:
+            self.queue_model.update_progress(item_id, val, text)
 
+    @Slot(str, str, str)
     def _on_completed(self, item_id, title, path):
-        if item_id in self.download_widgets:
-            self.download_widgets[item_id].set_completed()
+        self.queue_model.set_completed(item_id)
 
+    @Slot(str, str, str)
     def _on_failed(self, item_id, title, err):
-        if item_id in self.download_widgets:
-            self.download_widgets[item_id].set_failed(err)
+        self.queue_model.set_failed(item_id, err)
 
     def _select_folder(self):
         d = QFileDialog.getExistingDirectory(self, "Select Folder", self.download_path)
@@ -620,46 +789,51 @@ class MainWindow(QMainWindow):
             self.manager.set_output_dir(d)
 
     def _load_history(self):
-        self.hist_list.clear()
-        data = self.manager.get_history()
-        for idx, item in enumerate(data):
-            # Create a nice item
-            title = item.get('title', 'Unknown')
-            w = QListWidgetItem(f"{idx+1}. {title}")
-            self.hist_list.addItem(w)
+        self.hist_model.set_rows(self.manager.get_history())
 
     def _clear_queue(self):
-        # Remove widgets that are done (simple logic)
-        for i in reversed(range(self.queue_layout.count())):
-            w = self.queue_layout.itemAt(i).widget()
-            if isinstance(w, DownloadCard):
-                w.deleteLater()
-        self.download_widgets.clear()
+        self.queue_model.remove_completed()
 
     def _check_for_updates(self):
         """Check GitHub for new release."""
-        try:
-            url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-            resp = requests.get(url, timeout=5)
-            
-            if resp.status_code == 200:
-                data = resp.json()
-                latest_tag = data.get("tag_name", "").strip()
-                
-                # Check match (e.g. v2.1.0 vs v2.1.0)
-                if latest_tag and latest_tag != APP_VERSION:
-                    reply = QMessageBox.question(
-                        self, "Update Available",
-                        f"A new version ({latest_tag}) is available!\n\n"
-                        "Would you like to open the download page?",
-                        QMessageBox.Yes | QMessageBox.No
-                    )
-                    if reply == QMessageBox.Yes:
-                        webbrowser.open(data.get("html_url", "https://github.com/" + GITHUB_REPO))
-                else:
-                    QMessageBox.information(self, "Up to Date", f"You are using the latest version ({APP_VERSION}).")
-            else:
-                QMessageBox.warning(self, "Check Failed", "Could not connect to update server.")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Update check failed: {str(e)}")
+        settings = QSettings()
+        tag = settings.value("updates/tag", "")
+        if tag and time.time() - float(settings.value("updates/checked_at", 0)) < UPDATE_CHECK_COOLDOWN:
+            self._show_update_result(tag, settings.value("updates/html_url", ""))
+            return
+        
+        # GitHub answers 304 (no body, no rate-limit cost) if nothing changed
+        etag = settings.value("updates/etag", "")
+        headers = {"If-None-Match": etag} if tag and etag else None
+        
+        url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+        worker = HttpWorker(url, timeout=5, as_json=True, headers=headers)
+        worker.signals.finished.connect(self._on_update_info)
+        worker.signals.error.connect(
+            lambda err: QMessageBox.warning(self, "Check Failed", f"Could not connect to update server.\n{err}")
+        )
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_update_info(self, data, headers):
+        settings = QSettings()
+        if data is not None:
+            settings.setValue("updates/tag", data.get("tag_name", "").strip())
+            settings.setValue("updates/html_url", data.get("html_url", ""))
+            settings.setValue("updates/etag", headers.get("ETag", ""))
+        settings.setValue("updates/checked_at", time.time())
+        self._show_update_result(settings.value("updates/tag", ""), settings.value("updates/html_url", ""))
+
+    def _show_update_result(self, latest_tag, html_url):
+        # Check match (e.g. v2.1.0 vs v2.1.0)
+        if latest_tag and latest_tag != APP_VERSION:
+            reply = QMessageBox.question(
+                self, "Update Available",
+                f"A new version ({latest_tag}) is available!\n\n"
+                "Would you like to open the download page?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if reply == QMessageBox.Yes:
+                webbrowser.open(html_url or "https://github.com/" + GITHUB_REPO)
+        else:
+            QMessageBox.information(self, "Up to Date", f"You are using the latest version ({APP_VERSION}).")
 
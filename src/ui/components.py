@@ -1,10 +1,28 @@
+from functools import lru_cache
 from typing import List
 from PySide6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QPushButton, 
-    QDialog, QListWidget
+    QDialog, QScrollArea
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QFont, QColor, QPainter, QPen
+
+
+@lru_cache(maxsize=None)
+def ui_font(family: str, size: int, weight: QFont.Weight = QFont.Normal) -> QFont:
+    """Shared QFont instance, built on first use (after QApplication exists)."""
+    return QFont(family, size, weight)
+
+
+# Card colours, painted directly instead of via a stylesheet selector
+CARD_BACKGROUND = QColor(44, 44, 46)
+CARD_BORDER = QColor(58, 58, 60)
+CARD_RADIUS = 12
+
+
+def _short_title(title: str) -> str:
+    return title[:50] + ("…" if title[50:51] else "")
+
 
 class DownloadCard(QFrame):
     """Modern card widget for individual download progress."""
@@ -12,7 +30,6 @@ class DownloadCard(QFrame):
     def __init__(self, item_id: str, title: str, parent=None):
         super().__init__(parent)
         self.item_id = item_id
-        self.setObjectName("downloadCard")
         self.setFixedHeight(72)
         
         layout = QVBoxLayout(self)
@@ -21,12 +38,12 @@ class DownloadCard(QFrame):
         
         # Title row
         title_row = QHBoxLayout()
-        self.title_label = QLabel(title[:50] + "..." if len(title) > 50 else title)
-        self.title_label.setFont(QFont("SF Pro Text", 13, QFont.Medium))
+        self.title_label = QLabel(_short_title(title))
+        self.title_label.setFont(ui_font("SF Pro Text", 13, QFont.Medium))
         title_row.addWidget(self.title_label)
         
         self.status_label = QLabel("Waiting...")
-        self.status_label.setFont(QFont("SF Pro Text", 11))
+        self.status_label.setFont(ui_font("SF Pro Text", 11))
         self.status_label.setStyleSheet("color: #8e8e93;")
         title_row.addWidget(self.status_label, alignment=Qt.AlignRight)
         layout.addLayout(title_row)
@@ -38,10 +55,38 @@ class DownloadCard(QFrame):
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(4)
         layout.addWidget(self.progress_bar)
+        
+        # (progress, status) currently on screen
+        self._drawn = (0, "Waiting...")
+    
+    def reset(self, item_id: str, title: str):
+        """Reuse this card for another download."""
+        self.item_id = item_id
+        self.title_label.setText(_short_title(title))
+        self.status_label.setText("Waiting...")
+        self.status_label.setStyleSheet("color: #8e8e93;")
+        self.progress_bar.setValue(0)
+        self._drawn = (0, "Waiting...")
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(CARD_BORDER, 1))
+        painter.setBrush(CARD_BACKGROUND)
+        painter.drawRoundedRect(
+            QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), CARD_RADIUS, CARD_RADIUS
+        )
     
     def update_progress(self, progress: float, status: str):
-        self.progress_bar.setValue(int(progress))
-        self.status_label.setText(status)
+        # Only touch the widgets whose content actually changed
+        progress = int(progress)
+        if progress == self._drawn[0] and status == self._drawn[1]:
+            return
+        if progress != self._drawn[0]:
+            self.progress_bar.setValue(progress)
+        if status != self._drawn[1]:
+            self.status_label.setText(status)
+        self._drawn = (progress, status)
     
     def set_completed(self):
         self.progress_bar.setValue(100)
@@ -73,23 +118,24 @@ class DuplicateDialog(QDialog):
         layout.setContentsMargins(24, 24, 24, 24)
         
         # Header
-        count = len(duplicates)
-        header = QLabel(f"Found {count} file{'s' if count > 1 else ''} already in downloads folder:")
-        header.setFont(QFont("SF Pro Text", 14, QFont.Bold))
-        layout.addWidget(header)
-        
-        # File list
-        file_list = QListWidget()
-        file_list.setMaximumHeight(150)
-        for dup in duplicates[:10]:  # Show max 10
-            file_list.addItem(dup)
-        if count > 10:
-            file_list.addItem(f"... and {count - 10} more")
-        layout.addWidget(file_list)
+        self.header_label = QLabel()
+        self.header_label.setFont(ui_font("SF Pro Text", 14, QFont.Bold))
+        layout.addWidget(self.header_label)
+        
+        # File list (plain label; at most 11 short lines, no item model needed)
+        self.file_list = QLabel()
+        self.file_list.setTextFormat(Qt.PlainText)
+        self.file_list.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.file_list.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        file_scroll = QScrollArea()
+        file_scroll.setWidgetResizable(True)
+        file_scroll.setMaximumHeight(150)
+        file_scroll.setWidget(self.file_list)
+        layout.addWidget(file_scroll)
         
         # Question
         question = QLabel("What would you like to do?")
-        question.setFont(QFont("SF Pro Text", 13))
+        question.setFont(ui_font("SF Pro Text", 13))
         layout.addWidget(question)
         
         # Buttons
@@ -104,16 +150,31 @@ class DuplicateDialog(QDialog):
         replace_btn.clicked.connect(lambda: self._set_result(self.REPLACE))
         btn_layout.addWidget(replace_btn)
         
-        if count > 1:
-            skip_all_btn = QPushButton("Skip All")
-            skip_all_btn.clicked.connect(lambda: self._set_result(self.SKIP_ALL))
-            btn_layout.addWidget(skip_all_btn)
-            
-            replace_all_btn = QPushButton("Replace All")
-            replace_all_btn.clicked.connect(lambda: self._set_result(self.REPLACE_ALL))
-            btn_layout.addWidget(replace_all_btn)
+        self.skip_all_btn = QPushButton("Skip All")
+        self.skip_all_btn.clicked.connect(lambda: self._set_result(self.SKIP_ALL))
+        btn_layout.addWidget(self.skip_all_btn)
+        
+        self.replace_all_btn = QPushButton("Replace All")
+        self.replace_all_btn.clicked.connect(lambda: self._set_result(self.REPLACE_ALL))
+        btn_layout.addWidget(self.replace_all_btn)
         
         layout.addLayout(btn_layout)
+        
+        self.set_duplicates(duplicates)
+    
+    def set_duplicates(self, duplicates: List[str]):
+        """Refresh the dialog contents so one instance can be reused."""
+        self.result_action = self.SKIP
+        count = len(duplicates)
+        self.header_label.setText(f"Found {count} file{'s' if count > 1 else ''} already in downloads folder:")
+        
+        lines = list(duplicates[:10])  # Show max 10
+        if count > 10:
+            lines.append(f"... and {count - 10} more")
+        self.file_list.setText("\n".join(lines))
+        
+        self.skip_all_btn.setVisible(count > 1)
+        self.replace_all_btn.setVisible(count > 1)
     
     def _set_result(self, action: int):
         self.result_action = action
@@ -1,23 +1,205 @@
 
 import sys
-import os
 from pathlib import Path
-from typing import Optional, Dict
-from datetime import datetime
+from typing import Optional, Dict, List, Deque
+import time
+from collections import deque
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QTextEdit, QPushButton, QComboBox, QSpinBox,
+    QLabel, QLineEdit, QTextEdit, QPlainTextEdit, QPushButton, QComboBox, QSpinBox,
     QProgressBar, QFileDialog, QButtonGroup,
-    QListWidget, QListWidgetItem, QFrame, QMessageBox,
+    QListWidget, QFrame, QMessageBox,
     QTabWidget, QScrollArea, QSizePolicy
 )
-from PySide6.QtCore import Qt, Slot, QSize
-from PySide6.QtGui import QPalette, QColor, QFont, QIcon
+from PySide6.QtCore import Qt, Slot, QSize, QTimer, QEvent
+from PySide6.QtGui import QPalette, QColor, QFont, QIcon, QTextCursor
+
+from src.core.worker import DownloadManager, DownloadMode, MAX_WORKERS
+from src.core.utils import extract_youtube_urls, icon_path
+from src.ui.components import DownloadCard, DuplicateDialog, ui_font
+
+# Characters scanned by the live link counter; _on_start still scans everything
+URL_SCAN_LIMIT = 200_000
+# Shortest link extract_youtube_urls can match ("http://youtu.be/x")
+MIN_URL_LENGTH = 17
+# Oldest log lines are dropped past this many
+LOG_MAX_LINES = 5000
+# Cleared download cards kept for reuse
+CARD_POOL_LIMIT = 50
+
+STYLE_SHEET = """
+    QMainWindow {
+        background-color: #1c1c1e;
+    }
+
+    QTabWidget::pane {
+        border: none;
+        background-color: #1c1c1e;
+    }
+
+    QTabBar::tab {
+        background-color: transparent;
+        color: #8e8e93;
+        padding: 12px 24px;
+        font-size: 14px;
+        font-weight: 500;
+        border: none;
+    }
+
+    QTabBar::tab:selected {
+        color: #ffffff;
+        border-bottom: 2px solid #0a84ff;
+    }
+
+    QTabBar::tab:hover:!selected {
+        color: #ffffff;
+    }
+
+    QTextEdit, QPlainTextEdit {
+        background-color: #2c2c2e;
+        border: 1px solid #3a3a3c;
+        border-radius: 10px;
+        padding: 12px;
+        font-size: 14px;
+        color: #ffffff;
+    }
+
+    QTextEdit:focus, QPlainTextEdit:focus {
+        border: 1px solid #0a84ff;
+    }
+
+    QLineEdit {
+        background-color: #2c2c2e;
+        border: 1px solid #3a3a3c;
+        border-radius: 8px;
+        padding: 10px;
+        font-size: 14px;
+        color: #ffffff;
+    }
+
+    QPushButton {
+        background-color: #2c2c2e;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-size: 13px;
+        color: #ffffff;
+    }
+
+    QPushButton:hover {
+        background-color: #3a3a3c;
+    }
+
+    QPushButton:pressed {
+        background-color: #48484a;
+    }
+
+    QPushButton:disabled {
+        background-color: #2c2c2e;
+        color: #636366;
+    }
+
+    QPushButton:checked {
+        background-color: #0a84ff;
+    }
+
+    QPushButton#downloadBtn {
+        background-color: #0a84ff;
+        font-size: 15px;
+        font-weight: 600;
+    }
+
+    QPushButton#downloadBtn:hover {
+        background-color: #0077ed;
+    }
+
+    QComboBox {
+        background-color: #2c2c2e;
+        border: 1px solid #3a3a3c;
+        border-radius: 8px;
+        padding: 8px 12px;
+        font-size: 13px;
+        color: #ffffff;
+    }
+
+    QComboBox:disabled {
+        color: #636366;
+    }
+
+    QComboBox::drop-down {
+        border: none;
+        width: 24px;
+    }
+
+    QComboBox QAbstractItemView {
+        background-color: #2c2c2e;
+        selection-background-color: #0a84ff;
+        border-radius: 8px;
+    }
+
+    QSpinBox {
+        background-color: #2c2c2e;
+        border: 1px solid #3a3a3c;
+        border-radius: 8px;
+        padding: 8px;
+        font-size: 13px;
+        color: #ffffff;
+    }
+
+    QListWidget {
+        background-color: #2c2c2e;
+        border: 1px solid #3a3a3c;
+        border-radius: 10px;
+        padding: 8px;
+        font-size: 13px;
+    }
+
+    QListWidget::item {
+        padding: 12px;
+        border-radius: 6px;
+        margin: 2px 0;
+    }
+
+    QListWidget::item:selected {
+        background-color: #0a84ff;
+    }
+
+    QScrollArea {
+        background-color: transparent;
+        border: none;
+    }
+
+    QProgressBar {
+        background-color: #3a3a3c;
+        border: none;
+        border-radius: 2px;
+    }
+
+    QProgressBar::chunk {
+        background-color: #0a84ff;
+        border-radius: 2px;
+    }
+
+"""
+
+
+def _dark_palette() -> QPalette:
+    """Build the dark palette used by the desktop theme."""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(28, 28, 30))
+    palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
+    palette.setColor(QPalette.Base, QColor(44, 44, 46))
+    palette.setColor(QPalette.AlternateBase, QColor(58, 58, 60))
+    palette.setColor(QPalette.Text, QColor(255, 255, 255))
+    palette.setColor(QPalette.Button, QColor(58, 58, 60))
+    palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
+    palette.setColor(QPalette.Highlight, QColor(10, 132, 255))
+    palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
+    palette.setColor(QPalette.Disabled, QPalette.Text, QColor(128, 128, 128))
+    palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(128, 128, 128))
+    return palette
 
-from src.core.worker import DownloadManager, DownloadMode
-from src.core.utils import extract_youtube_urls, resource_path
-from src.ui.components import DownloadCard, DuplicateDialog
 
 class MainWindow(QMainWindow):
     """Main application window with modern tabbed interface."""
@@ -30,9 +212,9 @@ class MainWindow(QMainWindow):
         self.resize(800, 600)
         
         # Set window icon
-        icon_path = resource_path(os.path.join("assets", "icon.png"))
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        window_icon = icon_path("icon.png")
+        if window_icon:
+            self.setWindowIcon(QIcon(window_icon))
         
         # Default paths
         self.output_dir = str(Path.cwd() / "downloads")
@@ -44,18 +226,39 @@ class MainWindow(QMainWindow):
         
         # Track widgets
         self.download_cards: Dict[str, DownloadCard] = {}
+        self._card_pool: List[DownloadCard] = []
+        
+        # Coalesce bursts of keystrokes/paste into a single URL scan
+        self._url_scan_timer = QTimer(self)
+        self._url_scan_timer.setSingleShot(True)
+        self._url_scan_timer.setInterval(150)
+        self._url_scan_timer.timeout.connect(self._do_url_scan)
+        # Text up to the last whitespace already scanned, and its URLs
+        self._scan_head = ""
+        self._scan_head_urls: List[str] = []
+        
+        # Log lines are buffered and appended to the pane in one batch
+        self._log_buffer: Deque[str] = deque(maxlen=LOG_MAX_LINES)
+        self._ts_cache = (0, "")  # (epoch second, "HH:MM:SS")
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
         
         # Setup
         self._setup_ui()
         self._apply_modern_theme()
     
     def _connect_signals(self):
-        self.manager.signals.progress_updated.connect(self._on_progress_updated)
-        self.manager.signals.download_started.connect(self._on_download_started)
-        self.manager.signals.download_completed.connect(self._on_download_completed)
-        self.manager.signals.download_failed.connect(self._on_download_failed)
-        self.manager.signals.download_skipped.connect(self._on_download_skipped)
-        self.manager.signals.log_message.connect(self._on_log_message)
+        # Emitted from worker threads; queue them explicitly onto the GUI thread
+        signals = self.manager.signals
+        signals.download_started.connect(self._on_download_started, Qt.QueuedConnection)
+        signals.download_completed.connect(self._on_download_completed, Qt.QueuedConnection)
+        signals.download_failed.connect(self._on_download_failed, Qt.QueuedConnection)
+        signals.download_skipped.connect(self._on_download_skipped, Qt.QueuedConnection)
+        signals.log_message.connect(self._on_log_message, Qt.QueuedConnection)
+        # Batched by the manager on the GUI thread
+        signals.progress_batch.connect(self._on_progress_batch)
     
     def _setup_ui(self):
         central = QWidget()
@@ -70,11 +273,35 @@ class MainWindow(QMainWindow):
         self.tabs.setDocumentMode(True)
         main_layout.addWidget(self.tabs)
         
-        # Create tabs
+        # Create tabs - only Download is built up front, the rest are
+        # filled into placeholders the first time they're needed
         self.tabs.addTab(self._create_download_tab(), "Download")
-        self.tabs.addTab(self._create_queue_tab(), "Queue")
-        self.tabs.addTab(self._create_history_tab(), "History")
-        self.tabs.addTab(self._create_settings_tab(), "Settings")
+        self._tab_builders = {
+            1: self._create_queue_tab,
+            2: self._create_history_tab,
+            3: self._create_settings_tab,
+        }
+        self._tabs_built = {0: True}
+        for idx, name in ((1, "Queue"), (2, "History"), (3, "Settings")):
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(placeholder, name)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+    
+    @Slot(int)
+    def _ensure_tab_built(self, idx: int):
+        """Build a tab's real content on first use."""
+        if self._tabs_built.get(idx) or idx not in self._tab_builders:
+            return
+        self._tabs_built[idx] = True
+        self.tabs.widget(idx).layout().addWidget(self._tab_builders[idx]())
+    
+    @Slot(int)
+    def _on_tab_changed(self, idx: int):
+        # Catch up on log lines that arrived while the pane was hidden
+        if idx == 1:
+            self._flush_log()
     
     def _create_download_tab(self) -> QWidget:
         """Main download tab - clean and minimal with smart URL detection."""
@@ -85,13 +312,13 @@ class MainWindow(QMainWindow):
         
         # Header
         header = QLabel("Download")
-        header.setFont(QFont("SF Pro Display", 28, QFont.Bold))
+        header.setFont(ui_font("SF Pro Display", 28, QFont.Bold))
         layout.addWidget(header)
         
         # URL Input with helper text
         url_header = QHBoxLayout()
         url_label = QLabel("Paste any text containing YouTube links")
-        url_label.setFont(QFont("SF Pro Text", 13))
+        url_label.setFont(ui_font("SF Pro Text", 13))
         url_label.setStyleSheet("color: #8e8e93;")
         url_header.addWidget(url_label)
         
@@ -99,7 +326,7 @@ class MainWindow(QMainWindow):
         
         # Detected URLs counter
         self.url_count_label = QLabel("")
-        self.url_count_label.setFont(QFont("SF Pro Text", 12))
+        self.url_count_label.setFont(ui_font("SF Pro Text", 12))
         self.url_count_label.setStyleSheet("color: #30d158;")
         url_header.addWidget(self.url_count_label)
         
@@ -119,79 +346,65 @@ class MainWindow(QMainWindow):
         self.url_input.textChanged.connect(self._on_text_changed)
         layout.addWidget(self.url_input)
         
-        # Mode selection row
+        # Mode selection row: one flat layout, extra spacing stands in
+        # for the gaps between the former sub-groups
         mode_layout = QHBoxLayout()
-        mode_layout.setSpacing(24)
+        mode_layout.setSpacing(8)
         
         # Mode buttons
         self.mode_group = QButtonGroup(self)
         
-        mode_container = QHBoxLayout()
-        mode_container.setSpacing(16)
-        
         self.audio_btn = QPushButton("Audio")
         self.audio_btn.setCheckable(True)
         self.audio_btn.setChecked(True)
         self.audio_btn.setFixedSize(100, 40)
-        mode_container.addWidget(self.audio_btn)
+        mode_layout.addWidget(self.audio_btn)
+        mode_layout.addSpacing(8)
         
         self.video_btn = QPushButton("Video")
         self.video_btn.setCheckable(True)
         self.video_btn.setFixedSize(100, 40)
-        mode_container.addWidget(self.video_btn)
+        mode_layout.addWidget(self.video_btn)
         
         self.mode_group.addButton(self.audio_btn, 0)
         self.mode_group.addButton(self.video_btn, 1)
         
-        mode_layout.addLayout(mode_container)
         mode_layout.addStretch()
         
         # Audio format dropdown
-        audio_format_container = QHBoxLayout()
-        audio_format_container.setSpacing(8)
-        
         audio_format_label = QLabel("Format:")
-        audio_format_label.setFont(QFont("SF Pro Text", 13))
-        audio_format_container.addWidget(audio_format_label)
+        audio_format_label.setFont(ui_font("SF Pro Text", 13))
+        mode_layout.addWidget(audio_format_label)
         
         self.audio_format_combo = QComboBox()
         self.audio_format_combo.addItems(["MP3", "AAC", "WAV", "FLAC"])
         self.audio_format_combo.setFixedWidth(80)
-        audio_format_container.addWidget(self.audio_format_combo)
-        
-        mode_layout.addLayout(audio_format_container)
+        mode_layout.addWidget(self.audio_format_combo)
+        mode_layout.addSpacing(16)
         
         # Video format dropdown
-        video_format_container = QHBoxLayout()
-        video_format_container.setSpacing(8)
-        
         video_format_label = QLabel("Format:")
-        video_format_label.setFont(QFont("SF Pro Text", 13))
-        video_format_container.addWidget(video_format_label)
+        video_format_label.setFont(ui_font("SF Pro Text", 13))
+        mode_layout.addWidget(video_format_label)
         
         self.video_format_combo = QComboBox()
         self.video_format_combo.addItems(["MP4", "MKV", "WEBM"])
         self.video_format_combo.setFixedWidth(80)
         self.video_format_combo.setEnabled(False)
-        video_format_container.addWidget(self.video_format_combo)
-        
-        mode_layout.addLayout(video_format_container)
+        mode_layout.addWidget(self.video_format_combo)
+        mode_layout.addSpacing(16)
         
         # Quality dropdown (for video)
-        quality_container = QHBoxLayout()
-        quality_container.setSpacing(8)
-        
         quality_label = QLabel("Quality:")
-        quality_label.setFont(QFont("SF Pro Text", 13))
-        quality_container.addWidget(quality_label)
+        quality_label.setFont(ui_font("SF Pro Text", 13))
+        mode_layout.addWidget(quality_label)
         
         self.quality_combo = QComboBox()
         self.quality_combo.addItems(["Best", "1080p", "720p", "480p", "360p"])
         self.quality_combo.setEnabled(False)
         self.quality_combo.setFixedWidth(100)
-        quality_container.addWidget(self.quality_combo)
+        mode_layout.addWidget(self.quality_combo)
         
-        mode_layout.addLayout(quality_container)
         layout.addLayout(mode_layout)
         
         # Connect mode toggle
@@ -207,7 +420,7 @@ class MainWindow(QMainWindow):
         # Download button
         self.download_btn = QPushButton("Download")
         self.download_btn.setFixedHeight(50)
-        self.download_btn.setFont(QFont("SF Pro Text", 15, QFont.Medium))
+        self.download_btn.setFont(ui_font("SF Pro Text", 15, QFont.Medium))
         self.download_btn.clicked.connect(self._on_start)
         layout.addWidget(self.download_btn)
         
@@ -215,9 +428,33 @@ class MainWindow(QMainWindow):
     
     @Slot()
     def _on_text_changed(self):
-        """Update detected URL count when text changes."""
-        text = self.url_input.toPlainText()
-        urls = extract_youtube_urls(text)
+        """Schedule a URL scan once typing settles."""
+        # characterCount() includes the trailing paragraph separator; anything
+        # shorter than a link is cleared without copying the text out of Qt
+        if self.url_input.document().characterCount() <= MIN_URL_LENGTH:
+            self._url_scan_timer.stop()
+            self.url_count_label.setText("")
+            return
+        self._url_scan_timer.start()
+    
+    @Slot()
+    def _do_url_scan(self):
+        """Update detected URL count for the current text."""
+        text = self.url_input.toPlainText()[:URL_SCAN_LIMIT]
+        
+        # URLs never contain whitespace, so matches before the last space or
+        # newline are final; only rescan what was appended since then
+        if not text.startswith(self._scan_head):
+            self._scan_head, self._scan_head_urls = "", []
+        tail = text[len(self._scan_head):]
+        cut = max(tail.rfind(' '), tail.rfind('\n')) + 1
+        if cut:
+            self._scan_head += tail[:cut]
+            self._scan_head_urls = list(dict.fromkeys(
+                self._scan_head_urls + extract_youtube_urls(tail[:cut])
+            ))
+            tail = tail[cut:]
+        urls = dict.fromkeys(self._scan_head_urls + extract_youtube_urls(tail))
         count = len(urls)
         
         if count == 0:
@@ -238,7 +475,7 @@ class MainWindow(QMainWindow):
         header_row = QHBoxLayout()
         
         header = QLabel("Queue")
-        header.setFont(QFont("SF Pro Display", 28, QFont.Bold))
+        header.setFont(ui_font("SF Pro Display", 28, QFont.Bold))
         header_row.addWidget(header)
         
         header_row.addStretch()
@@ -283,10 +520,16 @@ class MainWindow(QMainWindow):
         layout.addWidget(scroll, 1)
         
         # Log output (collapsible)
-        self.log_output = QTextEdit()
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setUndoRedoEnabled(False)
+        self.log_output.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.log_output.setMaximumBlockCount(LOG_MAX_LINES)
         self.log_output.setMaximumHeight(120)
         self.log_output.setPlaceholderText("Log output...")
+        # Stays parked at the end of the document for incremental inserts
+        self._log_cursor = QTextCursor(self.log_output.document())
+        self._log_cursor.movePosition(QTextCursor.End)
         layout.addWidget(self.log_output)
         
         return tab
@@ -299,11 +542,12 @@ class MainWindow(QMainWindow):
         layout.setSpacing(16)
         
         header = QLabel("History")
-        header.setFont(QFont("SF Pro Display", 28, QFont.Bold))
+        header.setFont(ui_font("SF Pro Display", 28, QFont.Bold))
         layout.addWidget(header)
         
         self.history_list = QListWidget()
         self.history_list.setSpacing(4)
+        self.history_list.setUniformItemSizes(True)
         layout.addWidget(self.history_list, 1)
         
         refresh_btn = QPushButton("Refresh")
@@ -324,7 +568,7 @@ class MainWindow(QMainWindow):
         layout.setSpacing(24)
         
         header = QLabel("Settings")
-        header.setFont(QFont("SF Pro Display", 28, QFont.Bold))
+        header.setFont(ui_font("SF Pro Display", 28, QFont.Bold))
         layout.addWidget(header)
         
         # Output folder
@@ -332,7 +576,7 @@ class MainWindow(QMainWindow):
         folder_section.setSpacing(8)
         
         folder_label = QLabel("Output Folder")
-        folder_label.setFont(QFont("SF Pro Text", 13))
+        folder_label.setFont(ui_font("SF Pro Text", 13))
         folder_label.setStyleSheet("color: #8e8e93;")
         folder_section.addWidget(folder_label)
         
@@ -354,14 +598,14 @@ class MainWindow(QMainWindow):
         workers_section.setSpacing(16)
         
         workers_label = QLabel("Parallel Downloads")
-        workers_label.setFont(QFont("SF Pro Text", 14))
+        workers_label.setFont(ui_font("SF Pro Text", 14))
         workers_section.addWidget(workers_label)
         
         workers_section.addStretch()
         
         self.workers_spin = QSpinBox()
-        self.workers_spin.setRange(1, 5)
-        self.workers_spin.setValue(3)
+        self.workers_spin.setRange(1, MAX_WORKERS)
+        self.workers_spin.setValue(self.manager.max_workers)
         self.workers_spin.setFixedWidth(80)
         workers_section.addWidget(self.workers_spin)
         
@@ -372,7 +616,7 @@ class MainWindow(QMainWindow):
         speed_section.setSpacing(16)
         
         speed_label = QLabel("Speed Limit")
-        speed_label.setFont(QFont("SF Pro Text", 14))
+        speed_label.setFont(ui_font("SF Pro Text", 14))
         speed_section.addWidget(speed_label)
         
         speed_section.addStretch()
@@ -392,7 +636,7 @@ class MainWindow(QMainWindow):
         duplicate_section.setSpacing(16)
         
         duplicate_label = QLabel("If file exists")
-        duplicate_label.setFont(QFont("SF Pro Text", 14))
+        duplicate_label.setFont(ui_font("SF Pro Text", 14))
         duplicate_section.addWidget(duplicate_label)
         
         duplicate_section.addStretch()
@@ -424,184 +668,12 @@ class MainWindow(QMainWindow):
         app = QApplication.instance()
         app.setStyle("Fusion")
         
-        # Dark palette
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(28, 28, 30))
-        palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
-        palette.setColor(QPalette.Base, QColor(44, 44, 46))
-        palette.setColor(QPalette.AlternateBase, QColor(58, 58, 60))
-        palette.setColor(QPalette.Text, QColor(255, 255, 255))
-        palette.setColor(QPalette.Button, QColor(58, 58, 60))
-        palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
-        palette.setColor(QPalette.Highlight, QColor(10, 132, 255))
-        palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-        palette.setColor(QPalette.Disabled, QPalette.Text, QColor(128, 128, 128))
-        palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(128, 128, 128))
-        app.setPalette(palette)
-        
-        # Stylesheet
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1c1c1e;
-            }
-            
-            QTabWidget::pane {
-                border: none;
-                background-color: #1c1c1e;
-            }
-            
-            QTabBar::tab {
-                background-color: transparent;
-                color: #8e8e93;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: 500;
-                border: none;
-            }
-            
-            QTabBar::tab:selected {
-                color: #ffffff;
-                border-bottom: 2px solid #0a84ff;
-            }
-            
-            QTabBar::tab:hover:!selected {
-                color: #ffffff;
-            }
-            
-            QTextEdit {
-                background-color: #2c2c2e;
-                border: 1px solid #3a3a3c;
-                border-radius: 10px;
-                padding: 12px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QTextEdit:focus {
-                border: 1px solid #0a84ff;
-            }
-            
-            QLineEdit {
-                background-color: #2c2c2e;
-                border: 1px solid #3a3a3c;
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QPushButton {
-                background-color: #2c2c2e;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 13px;
-                color: #ffffff;
-            }
-            
-            QPushButton:hover {
-                background-color: #3a3a3c;
-            }
-            
-            QPushButton:pressed {
-                background-color: #48484a;
-            }
-            
-            QPushButton:disabled {
-                background-color: #2c2c2e;
-                color: #636366;
-            }
-            
-            QPushButton:checked {
-                background-color: #0a84ff;
-            }
-            
-            QPushButton#downloadBtn {
-                background-color: #0a84ff;
-                font-size: 15px;
-                font-weight: 600;
-            }
-            
-            QPushButton#downloadBtn:hover {
-                background-color: #0077ed;
-            }
-            
-            QComboBox {
-                background-color: #2c2c2e;
-                border: 1px solid #3a3a3c;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 13px;
-                color: #ffffff;
-            }
-            
-            QComboBox:disabled {
-                color: #636366;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 24px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: #2c2c2e;
-                selection-background-color: #0a84ff;
-                border-radius: 8px;
-            }
-            
-            QSpinBox {
-                background-color: #2c2c2e;
-                border: 1px solid #3a3a3c;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: 13px;
-                color: #ffffff;
-            }
-            
-            QListWidget {
-                background-color: #2c2c2e;
-                border: 1px solid #3a3a3c;
-                border-radius: 10px;
-                padding: 8px;
-                font-size: 13px;
-            }
-            
-            QListWidget::item {
-                padding: 12px;
-                border-radius: 6px;
-                margin: 2px 0;
-            }
-            
-            QListWidget::item:selected {
-                background-color: #0a84ff;
-            }
-            
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            
-            QProgressBar {
-                background-color: #3a3a3c;
-                border: none;
-                border-radius: 2px;
-            }
-            
-            QProgressBar::chunk {
-                background-color: #0a84ff;
-                border-radius: 2px;
-            }
-            
-            #downloadCard {
-                background-color: #2c2c2e;
-                border: 1px solid #3a3a3c;
-                border-radius: 12px;
-            }
-        """)
-        
-        # Set download button ID
+        app.setPalette(_dark_palette())
+        
+        # Set download button ID before the sheet is polished so the
+        # #downloadBtn rules apply on the single parse
         self.download_btn.setObjectName("downloadBtn")
+        self.setStyleSheet(STYLE_SHEET)
     
     # Event handlers
     @Slot()
@@ -635,6 +707,10 @@ class MainWindow(QMainWindow):
             )
             return
         
+        # Settings are read below and the queue receives the new cards
+        self._ensure_tab_built(1)
+        self._ensure_tab_built(3)
+        
         mode = DownloadMode.VIDEO if self.video_btn.isChecked() else DownloadMode.AUDIO
         quality = self.quality_combo.currentText().lower()
         speed_limit = self.speed_spin.value()
@@ -658,10 +734,7 @@ class MainWindow(QMainWindow):
         self.manager.set_worker_count(workers)
         self.manager.set_output_dir(self.output_dir)
         
-        for url in urls:
-            self.manager.add_url(url, mode, quality, speed_limit, output_format)
-        
-        self.manager.start()
+        self.manager.add_urls(urls, mode, quality, speed_limit, output_format)
         
         # Switch to queue tab
         self.tabs.setCurrentIndex(1)
@@ -683,37 +756,65 @@ class MainWindow(QMainWindow):
     
     @Slot()
     def _on_clear(self):
-        for card in list(self.download_cards.values()):
-            self.queue_layout.removeWidget(card)
-            card.deleteLater()
-        self.download_cards.clear()
-        self.empty_label.show()
+        # One relayout for the whole batch instead of one per removed card
+        self.queue_container.setUpdatesEnabled(False)
+        try:
+            for card in self.download_cards.values():
+                self.queue_layout.removeWidget(card)
+                if len(self._card_pool) < CARD_POOL_LIMIT:
+                    card.hide()
+                    self._card_pool.append(card)
+                else:
+                    card.deleteLater()
+            self.download_cards.clear()
+            self.empty_label.show()
+        finally:
+            self.queue_container.setUpdatesEnabled(True)
     
     @Slot()
     def _refresh_history(self):
-        self.history_list.clear()
+        if not self._tabs_built.get(2):
+            return  # Loaded when the History tab is first opened
         history = self.manager.get_history()
-        
-        for entry in history:
-            title = entry.get('title', 'Unknown')
-            mode = entry.get('mode', 'audio').upper()
-            ts = entry.get('timestamp', '')[:16].replace('T', ' ')
-            
-            item = QListWidgetItem(f"{title}\n{mode} • {ts}")
-            self.history_list.addItem(item)
+        rows = [
+            f"{entry.get('title', 'Unknown')}\n"
+            f"{entry.get('mode', 'audio').upper()} • {entry.get('timestamp', '')[:16].replace('T', ' ')}"
+            for entry in history
+        ]
+        
+        # Refill in one batch so the list lays out and repaints once
+        self.history_list.setUpdatesEnabled(False)
+        try:
+            self.history_list.clear()
+            self.history_list.addItems(rows)
+        finally:
+            self.history_list.setUpdatesEnabled(True)
     
     # Signal handlers
     @Slot(str, str)
     def _on_download_started(self, item_id: str, title: str):
-        self.empty_label.hide()
-        card = DownloadCard(item_id, title)
-        self.download_cards[item_id] = card
-        self.queue_layout.insertWidget(self.queue_layout.count() - 1, card)
+        self._ensure_tab_built(1)
+        self.queue_container.setUpdatesEnabled(False)
+        try:
+            self.empty_label.hide()
+            if self._card_pool:
+                card = self._card_pool.pop()
+                card.reset(item_id, title)
+            else:
+                card = DownloadCard(item_id, title)
+            self.download_cards[item_id] = card
+            # Insert above the trailing stretch
+            self.queue_layout.insertWidget(self.queue_layout.count() - 1, card)
+            card.show()
+        finally:
+            self.queue_container.setUpdatesEnabled(True)
     
-    @Slot(str, float, str)
-    def _on_progress_updated(self, item_id: str, progress: float, status: str):
-        if item_id in self.download_cards:
-            self.download_cards[item_id].update_progress(progress, status)
+    @Slot(list)
+    def _on_progress_batch(self, updates: list):
+        for item_id, progress, status in updates:
+            card = self.download_cards.get(item_id)
+            if card is not None:
+                card.update_progress(progress, status)
     
     @Slot(str, str, str)
     def _on_download_completed(self, item_id: str, title: str, output_path: str):
@@ -736,10 +837,44 @@ class MainWindow(QMainWindow):
         self._log(msg)
     
     def _log(self, msg: str):
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.log_output.append(f"[{ts}] {msg}")
+        # Format the timestamp once per second, not once per message
+        sec = int(time.time())
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+        ts = self._ts_cache[1]
+        self._log_buffer.append(f"[{ts}] {msg}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    @Slot()
+    def _flush_log(self):
+        """Write all buffered log lines with a single append."""
+        if not self._log_buffer:
+            return
+        # Keep buffering while the Queue tab (and its log pane) is out of
+        # sight; the deque is bounded, and switching back flushes it
+        if self.tabs.currentIndex() != 1 or self.isMinimized():
+            return
+        self._ensure_tab_built(1)
+        
+        # Only follow the output if the user hasn't scrolled up to read
         sb = self.log_output.verticalScrollBar()
-        sb.setValue(sb.maximum())
+        at_bottom = sb.value() == sb.maximum()
+        
+        batch = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        if not self.log_output.document().isEmpty():
+            batch = "\n" + batch
+        self._log_cursor.insertText(batch)
+        
+        if at_bottom:
+            sb.setValue(sb.maximum())
+    
+    def changeEvent(self, event):
+        # Lines buffered while minimized would otherwise wait for the next message
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self._flush_log()
+        super().changeEvent(event)
     
     def closeEvent(self, event):
         self.manager.stop()